@@ -10,6 +10,25 @@ from mininet.log import setLogLevel, info
 from mininet.link import TCLink
 import time
 import sys
+import re
+from subprocess import PIPE, DEVNULL, TimeoutExpired
+
+# Whole-line matchers for iperf bandwidth and ping RTT summary output
+_MBITS_RE = re.compile(r'^.*?[\d.]+\s*Mbits/sec.*$', re.M)
+_RTT_RE = re.compile(r'^.*rtt min/avg/max[^=]*=\s*[\d./]+\s*ms.*$', re.M)
+
+
+def wait_listening(host, port=5001, timeout=2.0):
+    """Poll until a TCP socket listens on port inside host, up to timeout s"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        probe = host.popen(['ss', '-Hltn', 'sport', '=', f':{port}'], stdout=PIPE, stderr=DEVNULL)
+        output, _ = probe.communicate()
+        if output.strip():
+            return True
+        time.sleep(0.01)
+    return False
+
 
 def test_load_balancing(controller_name="wrr"):
     """
@@ -40,108 +59,117 @@ def test_load_balancing(controller_name="wrr"):
     info("*** Starting network\n")
     net.start()
     
-    info("*** Waiting for controller to install flows...\n")
-    time.sleep(5)
-    
-    # Test 1: Basic connectivity
-    info("\n*** Test 1: Basic Connectivity (pingall) ***\n")
-    loss = net.pingAll()
-    info(f"Packet loss: {loss}%\n")
-    
-    if loss > 0:
-        info("WARNING: Network has connectivity issues!\n")
-    
-    # Test 2: Ping test antar pod
-    info("\n*** Test 2: Cross-pod Latency Test ***\n")
-    h1 = net.get('h1')
-    h5 = net.get('h5')
-    h9 = net.get('h9')
-    h13 = net.get('h13')
-    
-    for dst_host in [h5, h9, h13]:
-        result = h1.cmd(f'ping -c 10 {dst_host.IP()}')
-        info(f"h1 -> {dst_host.name}: ")
-        # Extract avg latency
-        lines = result.split('\n')
-        for line in lines:
-            if 'rtt min/avg/max' in line:
+    servers = []
+    try:
+        info("*** Waiting for controller to install flows...\n")
+        time.sleep(5)
+        
+        # Test 1: Basic connectivity
+        info("\n*** Test 1: Basic Connectivity (pingall) ***\n")
+        loss = net.pingAll()
+        info(f"Packet loss: {loss}%\n")
+        
+        if loss > 0:
+            info("WARNING: Network has connectivity issues!\n")
+        
+        # Test 2: Ping test antar pod
+        info("\n*** Test 2: Cross-pod Latency Test ***\n")
+        h1 = net.get('h1')
+        h5 = net.get('h5')
+        h9 = net.get('h9')
+        h13 = net.get('h13')
+        
+        for dst_host in [h5, h9, h13]:
+            result = h1.cmd(f'ping -c 10 {dst_host.IP()}')
+            info(f"h1 -> {dst_host.name}: ")
+            # Extract avg latency
+            m = _RTT_RE.search(result)
+            if m:
+                info(m.group(0) + '\n')
+        
+        # Test 3: Bandwidth test dengan iperf
+        info("\n*** Test 3: Bandwidth Test (iperf) ***\n")
+        
+        # Start iperf servers pada beberapa host
+        info("Starting iperf servers...\n")
+        h7 = net.get('h7')
+        servers = [h.popen(['iperf', '-s']) for h in (h5, h9, h13, h7)]
+        for h in (h5, h9, h13, h7):
+            wait_listening(h)
+        
+        # Run iperf clients
+        info("Running iperf clients...\n")
+        
+        info("h1 -> h5: ")
+        result = h1.cmd(f'iperf -c {h5.IP()} -t 5')
+        m = _MBITS_RE.search(result)
+        if m:
+            info(m.group(0).strip() + '\n')
+        
+        info("h2 -> h9: ")
+        h2 = net.get('h2')
+        result = h2.cmd(f'iperf -c {h9.IP()} -t 5')
+        m = _MBITS_RE.search(result)
+        if m:
+            info(m.group(0).strip() + '\n')
+        
+        # Test 4: Concurrent connections
+        info("\n*** Test 4: Concurrent Connections Test ***\n")
+        info("Starting 4 concurrent iperf flows...\n")
+        
+        h3 = net.get('h3')
+        h4 = net.get('h4')
+        
+        clients = [
+            h1.popen(['iperf', '-c', h5.IP(), '-t', '10']),
+            h2.popen(['iperf', '-c', h9.IP(), '-t', '10']),
+            h3.popen(['iperf', '-c', h13.IP(), '-t', '10']),
+            h4.popen(['iperf', '-c', h7.IP(), '-t', '10']),
+        ]
+        
+        # Wait only as long as the slowest client takes (20 s at most)
+        deadline = time.time() + 20
+        for p in clients:
+            try:
+                p.wait(timeout=max(deadline - time.time(), 0))
+            except TimeoutExpired:
+                p.kill()
+                p.wait()
+        info("Concurrent test completed\n")
+        
+        # Test 5: Check flow distribution
+        info("\n*** Test 5: Flow Distribution Analysis ***\n")
+        info("Checking flow statistics on switches...\n")
+        
+        # Check edge switch s13
+        info("\nEdge Switch s13 (e1) flows:\n")
+        result = net.get('s13').cmd('ovs-ofctl dump-flows s13 -O OpenFlow13')
+        for line in result.split('\n'):
+            if 'n_packets' in line and 'priority=10' in line:
                 info(line + '\n')
-                break
-    
-    # Test 3: Bandwidth test dengan iperf
-    info("\n*** Test 3: Bandwidth Test (iperf) ***\n")
-    
-    # Start iperf servers pada beberapa host
-    info("Starting iperf servers...\n")
-    h5.cmd('iperf -s &')
-    h9.cmd('iperf -s &')
-    h13.cmd('iperf -s &')
-    time.sleep(2)
-    
-    # Run iperf clients
-    info("Running iperf clients...\n")
-    
-    info("h1 -> h5: ")
-    result = h1.cmd(f'iperf -c {h5.IP()} -t 5')
-    for line in result.split('\n'):
-        if 'Mbits/sec' in line:
-            info(line.strip() + '\n')
-            break
-    
-    info("h2 -> h9: ")
-    h2 = net.get('h2')
-    result = h2.cmd(f'iperf -c {h9.IP()} -t 5')
-    for line in result.split('\n'):
-        if 'Mbits/sec' in line:
-            info(line.strip() + '\n')
-            break
-    
-    # Test 4: Concurrent connections
-    info("\n*** Test 4: Concurrent Connections Test ***\n")
-    info("Starting 4 concurrent iperf flows...\n")
-    
-    h1.cmd(f'iperf -c {h5.IP()} -t 10 &')
-    h2.cmd(f'iperf -c {h9.IP()} -t 10 &')
-    h3 = net.get('h3')
-    h3.cmd(f'iperf -c {h13.IP()} -t 10 &')
-    h4 = net.get('h4')
-    h7 = net.get('h7')
-    h4.cmd(f'iperf -c {h7.IP()} -t 10 &')
-    
-    time.sleep(12)
-    info("Concurrent test completed\n")
-    
-    # Test 5: Check flow distribution
-    info("\n*** Test 5: Flow Distribution Analysis ***\n")
-    info("Checking flow statistics on switches...\n")
-    
-    # Check edge switch s13
-    info("\nEdge Switch s13 (e1) flows:\n")
-    result = net.get('s13').cmd('ovs-ofctl dump-flows s13 -O OpenFlow13')
-    for line in result.split('\n'):
-        if 'n_packets' in line and 'priority=10' in line:
-            info(line + '\n')
-    
-    # Check agg switch s5
-    info("\nAgg Switch s5 (a1) flows:\n")
-    result = net.get('s5').cmd('ovs-ofctl dump-flows s5 -O OpenFlow13')
-    for line in result.split('\n'):
-        if 'n_packets' in line and 'priority=10' in line:
-            info(line + '\n')
-    
-    # Interactive CLI for manual testing
-    info("\n*** Entering CLI for manual testing ***\n")
-    info("Commands you can try:\n")
-    info("  - iperf h1 h5\n")
-    info("  - h1 ping -c 100 h5\n")
-    info("  - sh ovs-ofctl dump-flows s13 -O OpenFlow13\n")
-    info("  - xterm h1 h5 (for tcpdump)\n\n")
-    
-    CLI(net)
-    
-    # Cleanup
-    info("*** Stopping network\n")
-    net.stop()
+        
+        # Check agg switch s5
+        info("\nAgg Switch s5 (a1) flows:\n")
+        result = net.get('s5').cmd('ovs-ofctl dump-flows s5 -O OpenFlow13')
+        for line in result.split('\n'):
+            if 'n_packets' in line and 'priority=10' in line:
+                info(line + '\n')
+        
+        # Interactive CLI for manual testing
+        info("\n*** Entering CLI for manual testing ***\n")
+        info("Commands you can try:\n")
+        info("  - iperf h1 h5\n")
+        info("  - h1 ping -c 100 h5\n")
+        info("  - sh ovs-ofctl dump-flows s13 -O OpenFlow13\n")
+        info("  - xterm h1 h5 (for tcpdump)\n\n")
+        
+        CLI(net)
+    finally:
+        # Cleanup
+        info("*** Stopping network\n")
+        for proc in servers:
+            proc.terminate()
+        net.stop()
 
 
 def compare_algorithms():
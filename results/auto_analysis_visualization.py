@@ -8,18 +8,36 @@ Automatic Analysis and Visualization
 - Generate summary report
 """
 
-import json
+import io
 import os
-import glob
 import csv
+import mmap
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
 import pandas as pd
 
+try:
+    from ujson import loads as _small_loads
+except ImportError:
+    from json import loads as _small_loads
+
+# orjson parses a memoryview of an mmap without copying it
+try:
+    from orjson import loads as _big_loads
+except ImportError:
+    _big_loads = None
+
+# Above this size orjson's throughput outweighs its per-call overhead
+# and the mmap setup
+ORJSON_MIN_SIZE = 65536
+
 class AutoAnalyzer:
-    def __init__(self, results_dir='results'):
+    def __init__(self, results_dir='results', fmt='png'):
         self.results_dir = results_dir
+        # Output format for the low-density bar charts ('png' or 'svg');
+        # heterogeneous flow plots always stay PNG
+        self.fmt = fmt
         self.output_dir = f"analysis_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         os.makedirs(self.output_dir, exist_ok=True)
         
@@ -35,33 +53,53 @@ class AutoAnalyzer:
         print(f"{'='*60}\n")
         print(f"Output directory: {self.output_dir}")
     
+    def _load_one(self, filepath):
+        """Load a single JSON result file"""
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return {}
+            if _big_loads is None or size <= ORJSON_MIN_SIZE:
+                return _small_loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The view must be released before the mapping closes
+                with memoryview(mm) as view:
+                    return _big_loads(view)
+    
     def load_all_results(self):
         """Load all JSON results"""
         print("\n1. Loading test results...")
         
-        # Load homogeneous traffic results
-        for algo in ['wrr', 'wlc']:
-            pattern = f"{self.results_dir}/{algo}/**/metrics.json"
-            files = glob.glob(pattern, recursive=True)
-            
-            for filepath in files:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    self.data[f'{algo}_homogen'].append(data)
-            
-            print(f"   - Loaded {len(files)} {algo.upper()} homogeneous results")
+        algorithms = ('wrr', 'wlc')
         
-        # Load heterogeneous traffic results
-        for algo in ['wrr', 'wlc']:
-            pattern = f"{self.results_dir}/heterogen_traffic/{algo}/**/*.json"
-            files = glob.glob(pattern, recursive=True)
+        # Single walk over the results tree:
+        #   <results_dir>/<algo>/**/metrics.json                 -> homogeneous
+        #   <results_dir>/heterogen_traffic/<algo>/**/*.json     -> heterogeneous
+        for root, dirs, files in os.walk(self.results_dir):
+            rel = os.path.relpath(root, self.results_dir)
+            parts = [] if rel == os.curdir else rel.split(os.sep)
             
-            for filepath in files:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    self.data[f'{algo}_heterogen'].append(data)
+            if not parts:
+                # Only descend into directories that can hold results
+                dirs[:] = [d for d in dirs if d in algorithms or d == 'heterogen_traffic']
+                continue
             
-            print(f"   - Loaded {len(files)} {algo.upper()} heterogeneous results")
+            if parts[0] in algorithms:
+                if 'metrics.json' in files:
+                    filepath = os.path.join(root, 'metrics.json')
+                    self.data[f'{parts[0]}_homogen'].append(self._load_one(filepath))
+            elif len(parts) == 1:
+                dirs[:] = [d for d in dirs if d in algorithms]
+            elif parts[1] in algorithms:
+                for fn in files:
+                    if fn.endswith('.json'):
+                        filepath = os.path.join(root, fn)
+                        self.data[f'{parts[1]}_heterogen'].append(self._load_one(filepath))
+        
+        for algo in algorithms:
+            print(f"   - Loaded {len(self.data[f'{algo}_homogen'])} {algo.upper()} homogeneous results")
+        for algo in algorithms:
+            print(f"   - Loaded {len(self.data[f'{algo}_heterogen'])} {algo.upper()} heterogeneous results")
     
     def export_to_csv(self):
         """Export results to CSV files"""
@@ -96,29 +134,32 @@ class AutoAnalyzer:
         # ===== HETEROGENEOUS TRAFFIC CSV =====
         csv_heterogen = f"{self.output_dir}/results_heterogeneous_traffic.csv"
         
-        with open(csv_heterogen, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            writer.writerow([
-                'Algorithm', 'Scenario', 'Flow_Type', 
-                'Bandwidth_Requested', 'Throughput_Achieved_Mbps',
-                'Duration_sec', 'Protocol'
-            ])
-            
-            for algo in ['wrr', 'wlc']:
-                for result in self.data[f'{algo}_heterogen']:
-                    scenario = result.get('scenario', 'unknown')
-                    for flow in result.get('flows', []):
-                        writer.writerow([
-                            algo.upper(),
-                            scenario,
-                            f"{flow['src']}->{flow['dst']}",
-                            flow.get('bandwidth_requested', 'N/A'),
-                            flow.get('throughput_achieved', 0),
-                            flow.get('duration', 0),
-                            flow.get('protocol', 'tcp')
-                        ])
-        
+        header = [
+            'Algorithm', 'Scenario', 'Flow_Type',
+            'Bandwidth_Requested', 'Throughput_Achieved_Mbps',
+            'Duration_sec', 'Protocol'
+        ]
+
+        # Collect all flows first, then build the DataFrame in one go
+        rows = []
+        for algo in ['wrr', 'wlc']:
+            for result in self.data[f'{algo}_heterogen']:
+                scenario = result.get('scenario', 'unknown')
+                rows.extend(
+                    (
+                        algo.upper(),
+                        scenario,
+                        f"{flow['src']}->{flow['dst']}",
+                        flow.get('bandwidth_requested', 'N/A'),
+                        flow.get('throughput_achieved', 0),
+                        flow.get('duration', 0),
+                        flow.get('protocol', 'tcp')
+                    )
+                    for flow in result.get('flows', [])
+                )
+
+        pd.DataFrame(rows, columns=header).to_csv(csv_heterogen, index=False)
+
         print(f"   ✓ Saved: {csv_heterogen}")
     
     def extract_metrics_row(self, algorithm, result):
@@ -205,66 +246,92 @@ class AutoAnalyzer:
         wlc_data = df[df['Algorithm'] == 'WLC']
         
         metrics = [
-            ('Throughput_Avg_Mbps', 'Throughput (Mbps)', 'throughput.png'),
-            ('Delay_Avg_ms', 'Average Delay (ms)', 'delay.png'),
-            ('Jitter_Avg_ms', 'Average Jitter (ms)', 'jitter.png'),
-            ('Packet_Loss_%', 'Packet Loss (%)', 'packet_loss.png'),
-            ('CPU_Avg_%', 'CPU Utilization (%)', 'cpu.png'),
-            ('Fairness_Index', 'Fairness Index', 'fairness.png'),
-            ('Response_Time_Avg_ms', 'Response Time (ms)', 'response_time.png'),
+            ('Throughput_Avg_Mbps', 'Throughput (Mbps)', 'throughput'),
+            ('Delay_Avg_ms', 'Average Delay (ms)', 'delay'),
+            ('Jitter_Avg_ms', 'Average Jitter (ms)', 'jitter'),
+            ('Packet_Loss_%', 'Packet Loss (%)', 'packet_loss'),
+            ('CPU_Avg_%', 'CPU Utilization (%)', 'cpu'),
+            ('Fairness_Index', 'Fairness Index', 'fairness'),
+            ('Response_Time_Avg_ms', 'Response Time (ms)', 'response_time'),
         ]
         
-        for metric, ylabel, filename in metrics:
+        # One figure for all metrics; per-metric PNGs are cropped from it
+        fig, axes = plt.subplots(2, 4, figsize=(20, 10), sharex=True)
+        axes = axes.flatten()
+        plotted = []
+        
+        # Bar positions are the same for every metric
+        x = np.arange(len(wrr_data))
+        width = 0.35
+        x_minus = x - width/2
+        x_plus = x + width/2
+        
+        for i, (metric, ylabel, name) in enumerate(metrics):
+            ax = axes[i]
             if metric not in df.columns:
+                ax.set_visible(False)
                 continue
             
-            plt.figure(figsize=(10, 6))
-            
-            # Bar chart
-            x = np.arange(len(wrr_data))
-            width = 0.35
-            
             try:
                 wrr_values = wrr_data[metric].astype(float)
                 wlc_values = wlc_data[metric].astype(float)
                 
-                plt.bar(x - width/2, wrr_values, width, label='WRR', alpha=0.8)
-                plt.bar(x + width/2, wlc_values, width, label='WLC', alpha=0.8)
-                
-                plt.xlabel('Test Run')
-                plt.ylabel(ylabel)
-                plt.title(f'{ylabel} - WRR vs WLC')
-                plt.legend()
-                plt.grid(True, alpha=0.3)
-                plt.tight_layout()
-                
-                filepath = f"{graphs_dir}/{filename}"
-                plt.savefig(filepath, dpi=300, bbox_inches='tight')
-                plt.close()
+                # Bar chart
+                ax.bar(x_minus, wrr_values, width, label='WRR', alpha=0.8)
+                ax.bar(x_plus, wlc_values, width, label='WLC', alpha=0.8)
                 
-                print(f"   ✓ Generated: {filename}")
+                ax.set_xlabel('Test Run')
+                ax.set_ylabel(ylabel)
+                ax.set_title(f'{ylabel} - WRR vs WLC')
+                ax.tick_params(labelbottom=True)
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+                plotted.append((ax, name))
             except Exception as e:
                 print(f"   ⚠ Could not plot {metric}: {e}")
-                plt.close()
+                ax.set_visible(False)
+        
+        # Hide any unused grid cells
+        for ax in axes[len(metrics):]:
+            ax.set_visible(False)
+        
+        fig.tight_layout()
+        renderer = fig.canvas.get_renderer()
+        
+        for ax, name in plotted:
+            bbox = ax.get_tightbbox(renderer).transformed(fig.dpi_scale_trans.inverted())
+            filename = f"{name}.{self.fmt}"
+            filepath = f"{graphs_dir}/{filename}"
+            fig.savefig(filepath, dpi=300, bbox_inches=bbox.expanded(1.02, 1.02))
+            print(f"   ✓ Generated: {filename}")
+        
+        if plotted:
+            filename = f"all_metrics.{self.fmt}"
+            fig.savefig(f"{graphs_dir}/{filename}", dpi=300, bbox_inches='tight')
+            print(f"   ✓ Generated: {filename}")
+        plt.close(fig)
     
     def plot_heterogeneous_comparison(self, df, graphs_dir):
         """Plot heterogeneous traffic comparison"""
         
         scenarios = df['Scenario'].unique()
+        # Categorical key for grouping only; the caller's df is left as is
+        scenario_key = df['Scenario'].astype('category')
+        
+        # Split throughput by (scenario, algorithm) in a single pass
+        empty = np.array([], dtype=float)
+        values = {scenario: {'WRR': empty, 'WLC': empty} for scenario in scenarios}
+        groups = df.groupby([scenario_key, df['Algorithm']], observed=True)['Throughput_Achieved_Mbps']
+        for (scenario, algo), series in groups:
+            values[scenario][algo] = series.values.astype(float)
         
         for scenario in scenarios:
-            scenario_data = df[df['Scenario'] == scenario]
-            
-            # Group by algorithm
-            wrr_data = scenario_data[scenario_data['Algorithm'] == 'WRR']
-            wlc_data = scenario_data[scenario_data['Algorithm'] == 'WLC']
-            
             # Plot throughput comparison
             plt.figure(figsize=(12, 6))
             
             try:
-                wrr_throughput = wrr_data['Throughput_Achieved_Mbps'].astype(float)
-                wlc_throughput = wlc_data['Throughput_Achieved_Mbps'].astype(float)
+                wrr_throughput = values[scenario]['WRR']
+                wlc_throughput = values[scenario]['WLC']
                 
                 x_wrr = range(len(wrr_throughput))
                 x_wlc = range(len(wlc_throughput))
@@ -289,7 +356,7 @@ class AutoAnalyzer:
                 
                 filename = f"heterogen_{scenario}_throughput.png"
                 filepath = f"{graphs_dir}/{filename}"
-                plt.savefig(filepath, dpi=300, bbox_inches='tight')
+                plt.savefig(filepath, dpi=150)
                 plt.close()
                 
                 print(f"   ✓ Generated: {filename}")
@@ -303,79 +370,84 @@ class AutoAnalyzer:
         
         summary_file = f"{self.output_dir}/summary_comparison.txt"
         
-        with open(summary_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("LOAD BALANCING ALGORITHM COMPARISON SUMMARY\n")
-            f.write("="*80 + "\n\n")
+        # Build the whole report in memory, then write it out once
+        buf = io.StringIO()
+        buf.write("="*80 + "\n")
+        buf.write("LOAD BALANCING ALGORITHM COMPARISON SUMMARY\n")
+        buf.write("="*80 + "\n\n")
+        
+        buf.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        # Homogeneous Traffic Summary
+        buf.write("1. HOMOGENEOUS TRAFFIC RESULTS\n")
+        buf.write("-"*80 + "\n")
+        
+        try:
+            df = pd.read_csv(f"{self.output_dir}/results_homogeneous_traffic.csv")
             
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            # Group by algorithm (single pass over the DataFrame)
+            summary = df.groupby('Algorithm').mean(numeric_only=True).reindex(['WRR', 'WLC'])
+            wrr_avg = summary.loc['WRR']
+            wlc_avg = summary.loc['WLC']
+
+            buf.write(f"\nWRR Average Metrics:\n")
+            buf.write(wrr_avg.to_string())
+            buf.write(f"\n\nWLC Average Metrics:\n")
+            buf.write(wlc_avg.to_string())
+            buf.write("\n\n")
+
+            # Winner determination (lower is better for loss/delay/jitter/response time)
+            lower_is_better = summary.columns.str.contains('loss|delay|jitter|response', case=False)
+            winners = np.where(
+                lower_is_better,
+                np.where(wrr_avg < wlc_avg, 'WRR', 'WLC'),
+                np.where(wrr_avg > wlc_avg, 'WRR', 'WLC')
+            )
+
+            buf.write("WINNER by Metric:\n")
+            for metric, winner in zip(summary.columns, winners):
+                buf.write(f"  {metric}: {winner}\n")
             
-            # Homogeneous Traffic Summary
-            f.write("1. HOMOGENEOUS TRAFFIC RESULTS\n")
-            f.write("-"*80 + "\n")
+        except Exception as e:
+            buf.write(f"Error processing homogeneous data: {e}\n")
+        
+        buf.write("\n" + "="*80 + "\n\n")
+        
+        # Heterogeneous Traffic Summary
+        buf.write("2. HETEROGENEOUS TRAFFIC RESULTS\n")
+        buf.write("-"*80 + "\n")
+        
+        try:
+            df = pd.read_csv(f"{self.output_dir}/results_heterogeneous_traffic.csv")
             
-            try:
-                df = pd.read_csv(f"{self.output_dir}/results_homogeneous_traffic.csv")
+            for scenario in df['Scenario'].unique():
+                buf.write(f"\nScenario: {scenario}\n")
+                buf.write("-"*40 + "\n")
                 
-                # Group by algorithm
-                wrr_avg = df[df['Algorithm'] == 'WRR'].select_dtypes(include=[np.number]).mean()
-                wlc_avg = df[df['Algorithm'] == 'WLC'].select_dtypes(include=[np.number]).mean()
+                scenario_data = df[df['Scenario'] == scenario]
                 
-                f.write(f"\nWRR Average Metrics:\n")
-                f.write(wrr_avg.to_string())
-                f.write(f"\n\nWLC Average Metrics:\n")
-                f.write(wlc_avg.to_string())
-                f.write("\n\n")
+                wrr_throughput = scenario_data[scenario_data['Algorithm'] == 'WRR']['Throughput_Achieved_Mbps'].astype(float)
+                wlc_throughput = scenario_data[scenario_data['Algorithm'] == 'WLC']['Throughput_Achieved_Mbps'].astype(float)
                 
-                # Winner determination
-                f.write("WINNER by Metric:\n")
-                for metric in wrr_avg.index:
-                    if 'loss' in metric.lower() or 'delay' in metric.lower() or 'jitter' in metric.lower():
-                        # Lower is better
-                        winner = 'WRR' if wrr_avg[metric] < wlc_avg[metric] else 'WLC'
-                    else:
-                        # Higher is better
-                        winner = 'WRR' if wrr_avg[metric] > wlc_avg[metric] else 'WLC'
-                    
-                    f.write(f"  {metric}: {winner}\n")
+                buf.write(f"  WRR: Avg={wrr_throughput.mean():.2f} Mbps, Std={wrr_throughput.std():.2f}\n")
+                buf.write(f"  WLC: Avg={wlc_throughput.mean():.2f} Mbps, Std={wlc_throughput.std():.2f}\n")
                 
-            except Exception as e:
-                f.write(f"Error processing homogeneous data: {e}\n")
-            
-            f.write("\n" + "="*80 + "\n\n")
-            
-            # Heterogeneous Traffic Summary
-            f.write("2. HETEROGENEOUS TRAFFIC RESULTS\n")
-            f.write("-"*80 + "\n")
-            
-            try:
-                df = pd.read_csv(f"{self.output_dir}/results_heterogeneous_traffic.csv")
-                
-                for scenario in df['Scenario'].unique():
-                    f.write(f"\nScenario: {scenario}\n")
-                    f.write("-"*40 + "\n")
-                    
-                    scenario_data = df[df['Scenario'] == scenario]
-                    
-                    wrr_throughput = scenario_data[scenario_data['Algorithm'] == 'WRR']['Throughput_Achieved_Mbps'].astype(float)
-                    wlc_throughput = scenario_data[scenario_data['Algorithm'] == 'WLC']['Throughput_Achieved_Mbps'].astype(float)
-                    
-                    f.write(f"  WRR: Avg={wrr_throughput.mean():.2f} Mbps, Std={wrr_throughput.std():.2f}\n")
-                    f.write(f"  WLC: Avg={wlc_throughput.mean():.2f} Mbps, Std={wlc_throughput.std():.2f}\n")
-                    
-                    winner = 'WRR' if wrr_throughput.mean() > wlc_throughput.mean() else 'WLC'
-                    f.write(f"  Winner: {winner}\n")
-            
-            except Exception as e:
-                f.write(f"Error processing heterogeneous data: {e}\n")
-            
-            f.write("\n" + "="*80 + "\n")
+                winner = 'WRR' if wrr_throughput.mean() > wlc_throughput.mean() else 'WLC'
+                buf.write(f"  Winner: {winner}\n")
+        
+        except Exception as e:
+            buf.write(f"Error processing heterogeneous data: {e}\n")
+        
+        buf.write("\n" + "="*80 + "\n")
+        
+        report = buf.getvalue()
+        with open(summary_file, 'w') as f:
+            f.write(report)
         
         print(f"   ✓ Saved: {summary_file}")
         
         # Also print to console
-        with open(summary_file, 'r') as f:
-            print("\n" + f.read())
+        print("\n" + report)
     
     def run_full_analysis(self):
         """Run complete analysis pipeline"""
@@ -391,13 +463,21 @@ class AutoAnalyzer:
         print("\nContents:")
         print("  - results_homogeneous_traffic.csv")
         print("  - results_heterogeneous_traffic.csv")
-        print("  - graphs/ (PNG files)")
+        print(f"  - graphs/ ({self.fmt.upper()} bar charts, PNG flow plots)")
         print("  - summary_comparison.txt")
         print("\n")
 
 
 def main():
-    analyzer = AutoAnalyzer()
+    import sys
+    
+    # Optional: python3 auto_analysis_visualization.py [png|svg]
+    fmt = sys.argv[1].lower() if len(sys.argv) > 1 else 'png'
+    if fmt not in ['png', 'svg']:
+        print("Error: Format must be 'png' or 'svg'")
+        sys.exit(1)
+    
+    analyzer = AutoAnalyzer(fmt=fmt)
     analyzer.run_full_analysis()
 
 
@@ -1,8 +1,47 @@
-import json
 import os
-import glob
+import mmap
 from datetime import datetime
 import csv
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer a faster JSON parser when one is installed
+try:
+    from msgspec import DecodeError
+    from msgspec.json import decode as _loads
+    _LOADS_BUFFER = True    # msgspec/orjson parse a memoryview without copying
+    # msgspec's DecodeError is not a ValueError
+    _LOAD_ERRORS = (OSError, ValueError, DecodeError)
+except ImportError:
+    _LOAD_ERRORS = (OSError, ValueError)
+    try:
+        from orjson import loads as _loads
+        _LOADS_BUFFER = True
+    except ImportError:
+        _LOADS_BUFFER = False
+        try:
+            from ujson import loads as _loads
+        except ImportError:
+            from json import loads as _loads
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_SIZE = 65536
+
+def _stats(a):
+    """Return (mean, min, max) of a float64 array, or zeros if it is empty"""
+    if a.size == 0:
+        return 0.0, 0.0, 0.0
+    return a.mean(), a.min(), a.max()
+
+
+# Compile the statistics kernel when numba is installed
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    _stats = njit(cache=True)(_stats)
 
 
 class ResultsExporter:
@@ -12,211 +51,274 @@ class ResultsExporter:
         self.results_dir = results_dir
         self.export_dir = "results/exports"
         os.makedirs(self.export_dir, exist_ok=True)
+        # Parsed results keyed by path: {path: ((mtime_ns, size), data)}
+        self._parsed = {}
+        # Paths that failed to load; not retried
+        self._bad_files = set()
     
     def find_all_results(self):
         """Find all JSON result files"""
-        pattern = f"{self.results_dir}/**/*.json"
-        files = glob.glob(pattern, recursive=True)
-        return files
+        return list(self._iter_json_files(self.results_dir))
+    
+    def _iter_json_files(self, path):
+        """Recursively yield JSON file paths under path using os.scandir"""
+        subdirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith('.') or entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                elif entry.is_file() and entry.name.endswith('.json'):
+                    yield entry.path
+        
+        for subdir in subdirs:
+            yield from self._iter_json_files(subdir)
     
     def load_json(self, filepath):
-        """Load JSON file"""
+        """Load JSON file, reusing the parsed data while the file is unchanged"""
+        if filepath in self._bad_files:
+            return None
+        
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except:
+            with open(filepath, 'rb') as f:
+                st = os.fstat(f.fileno())
+                key = (st.st_mtime_ns, st.st_size)
+                cached = self._parsed.get(filepath)
+                if cached and cached[0] == key:
+                    return cached[1]
+                
+                data = self._parse_json(f, st.st_size)
+                self._parsed[filepath] = (key, data)
+                return data
+        except _LOAD_ERRORS as e:
+            self._bad_files.add(filepath)
+            print(f"⚠️  Skipping {filepath}: {e}")
             return None
     
-    def export_summary_csv(self, results_files):
-        """Export summary of all tests to CSV"""
+    def _parse_json(self, f, size):
+        """Parse an open binary JSON file, memory-mapping large ones"""
+        if size < MMAP_MIN_SIZE:
+            return _loads(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _LOADS_BUFFER:
+                with memoryview(mm) as view:
+                    return _loads(view)
+            return _loads(mm[:])
+    
+    def export_summary_csv(self, rows):
+        """Export summary of all tests to CSV
+        
+        rows: summary rows built by summary_row()
+        """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         csv_file = f"{self.export_dir}/summary_{timestamp}.csv"
         
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow([
-                'Scenario',
-                'Algorithm',
-                'TCP Throughput Avg (Mbps)',
-                'TCP Throughput Min (Mbps)',
-                'TCP Throughput Max (Mbps)',
-                'UDP Throughput Avg (Mbps)',
-                'UDP Throughput Min (Mbps)',
-                'UDP Throughput Max (Mbps)',
-                'Delay Avg (ms)',
-                'Delay Min (ms)',
-                'Delay Max (ms)',
-                'Jitter Avg (ms)',
-                'Jitter Min (ms)',
-                'Jitter Max (ms)',
-                'Packet Loss Avg (%)',
-                'Packet Loss Max (%)',
-                'CPU Avg (%)',
-                'CPU Max (%)',
-                'CPU Min (%)',
-                'Fairness Index',
-                'Response Time Avg (ms)',
-                'Total Flows',
-                'TCP Flows',
-                'UDP Flows',
-                'Test Date'
-            ])
-            
-            # Data rows
-            for filepath in results_files:
-                data = self.load_json(filepath)
-                if not data:
-                    continue
-                
-                # Calculate statistics
-                tcp_throughput = data.get('throughput', {}).get('tcp', [])
-                udp_throughput = data.get('throughput', {}).get('udp', [])
-                delays = data.get('delay', [])
-                jitters = data.get('jitter', [])
-                packet_loss = data.get('packet_loss', [])
-                cpu = data.get('cpu_utilization', {})
-                response_times = data.get('response_time', [])
-                flows = data.get('flows', [])
-                
-                # TCP Throughput stats
-                tcp_avg = sum(tcp_throughput) / len(tcp_throughput) if tcp_throughput else 0
-                tcp_min = min(tcp_throughput) if tcp_throughput else 0
-                tcp_max = max(tcp_throughput) if tcp_throughput else 0
-                
-                # UDP Throughput stats
-                udp_avg = sum(udp_throughput) / len(udp_throughput) if udp_throughput else 0
-                udp_min = min(udp_throughput) if udp_throughput else 0
-                udp_max = max(udp_throughput) if udp_throughput else 0
-                
-                # Delay stats
-                if delays:
-                    delay_avgs = [d['avg'] for d in delays]
-                    delay_avg = sum(delay_avgs) / len(delay_avgs)
-                    delay_min = min([d['min'] for d in delays])
-                    delay_max = max([d['max'] for d in delays])
-                else:
-                    delay_avg = delay_min = delay_max = 0
-                
-                # Jitter stats
-                jitter_avg = sum(jitters) / len(jitters) if jitters else 0
-                jitter_min = min(jitters) if jitters else 0
-                jitter_max = max(jitters) if jitters else 0
-                
-                # Packet loss stats
-                loss_avg = sum(packet_loss) / len(packet_loss) if packet_loss else 0
-                loss_max = max(packet_loss) if packet_loss else 0
-                
-                # Response time
-                rt_avg = sum(response_times) / len(response_times) if response_times else 0
-                
-                # Flow counts
-                tcp_flows = len([f for f in flows if f.get('protocol') == 'tcp'])
-                udp_flows = len([f for f in flows if f.get('protocol') == 'udp'])
-                
-                writer.writerow([
-                    data.get('scenario', 'unknown'),
-                    data.get('algorithm', 'unknown'),
-                    f"{tcp_avg:.2f}",
-                    f"{tcp_min:.2f}",
-                    f"{tcp_max:.2f}",
-                    f"{udp_avg:.4f}",
-                    f"{udp_min:.4f}",
-                    f"{udp_max:.4f}",
-                    f"{delay_avg:.2f}",
-                    f"{delay_min:.2f}",
-                    f"{delay_max:.2f}",
-                    f"{jitter_avg:.4f}",
-                    f"{jitter_min:.4f}",
-                    f"{jitter_max:.4f}",
-                    f"{loss_avg:.4f}",
-                    f"{loss_max:.4f}",
-                    f"{cpu.get('avg', 0):.2f}",
-                    f"{cpu.get('max', 0):.2f}",
-                    f"{cpu.get('min', 0):.2f}",
-                    f"{data.get('fairness_index', 0):.4f}",
-                    f"{rt_avg:.2f}",
-                    len(flows),
-                    tcp_flows,
-                    udp_flows,
-                    data.get('start_time', 'unknown')
-                ])
+        columns = [
+            'Scenario',
+            'Algorithm',
+            'TCP Throughput Avg (Mbps)',
+            'TCP Throughput Min (Mbps)',
+            'TCP Throughput Max (Mbps)',
+            'UDP Throughput Avg (Mbps)',
+            'UDP Throughput Min (Mbps)',
+            'UDP Throughput Max (Mbps)',
+            'Delay Avg (ms)',
+            'Delay Min (ms)',
+            'Delay Max (ms)',
+            'Jitter Avg (ms)',
+            'Jitter Min (ms)',
+            'Jitter Max (ms)',
+            'Packet Loss Avg (%)',
+            'Packet Loss Max (%)',
+            'CPU Avg (%)',
+            'CPU Max (%)',
+            'CPU Min (%)',
+            'Fairness Index',
+            'Response Time Avg (ms)',
+            'Total Flows',
+            'TCP Flows',
+            'UDP Flows',
+            'Test Date'
+        ]
+        # Columns written with 2 decimals; remaining float columns use 4
+        two_dp = [
+            'TCP Throughput Avg (Mbps)',
+            'TCP Throughput Min (Mbps)',
+            'TCP Throughput Max (Mbps)',
+            'Delay Avg (ms)',
+            'Delay Min (ms)',
+            'Delay Max (ms)',
+            'CPU Avg (%)',
+            'CPU Max (%)',
+            'CPU Min (%)',
+            'Response Time Avg (ms)'
+        ]
+        four_dp = [
+            'UDP Throughput Avg (Mbps)',
+            'UDP Throughput Min (Mbps)',
+            'UDP Throughput Max (Mbps)',
+            'Jitter Avg (ms)',
+            'Jitter Min (ms)',
+            'Jitter Max (ms)',
+            'Packet Loss Avg (%)',
+            'Packet Loss Max (%)',
+            'Fairness Index'
+        ]
+        
+        self._write_table(csv_file, columns, rows, two_dp, four_dp)
         
         print(f"✅ Summary exported to: {csv_file}")
         return csv_file
     
-    def export_detailed_flows_csv(self, results_files):
-        """Export detailed per-flow data to CSV"""
+    def _write_table(self, csv_file, columns, rows, two_dp, four_dp):
+        """Write rows to csv_file via pandas, with 2 or 4 decimal float columns"""
+        # Build the frame column by column so every column is converted
+        # to its final dtype exactly once
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        table = {}
+        for col, column_values in zip(columns, values):
+            if col in two_dp:
+                table[col] = np.char.mod('%.2f', np.asarray(column_values, dtype=np.float64))
+            elif col in four_dp:
+                table[col] = np.asarray(column_values, dtype=np.float64)
+            else:
+                table[col] = list(column_values)
+        
+        df = pd.DataFrame(table, columns=columns)
+        with open(csv_file, 'w', newline='', buffering=1 << 20) as f:
+            df.to_csv(f, index=False, float_format='%.4f', lineterminator='\r\n')
+    
+    def summary_row(self, data):
+        """Build one summary CSV row from a parsed result file"""
+        # Calculate statistics
+        throughput = data.get('throughput') or {}
+        tcp_throughput = throughput.get('tcp') or []
+        udp_throughput = throughput.get('udp') or []
+        delays = data.get('delay', [])
+        jitters = data.get('jitter', [])
+        packet_loss = data.get('packet_loss', [])
+        cpu = data.get('cpu_utilization') or {}
+        response_times = data.get('response_time', [])
+        flows = data.get('flows', [])
+        
+        # TCP Throughput stats
+        tcp = np.asarray(tcp_throughput, dtype=np.float64)
+        tcp_avg, tcp_min, tcp_max = _stats(tcp)
+        
+        # UDP Throughput stats
+        udp = np.asarray(udp_throughput, dtype=np.float64)
+        udp_avg, udp_min, udp_max = _stats(udp)
+        
+        # Delay stats
+        n = len(delays)
+        delay_avg = _stats(np.fromiter((d['avg'] for d in delays), dtype=np.float64, count=n))[0]
+        delay_min = _stats(np.fromiter((d['min'] for d in delays), dtype=np.float64, count=n))[1]
+        delay_max = _stats(np.fromiter((d['max'] for d in delays), dtype=np.float64, count=n))[2]
+        
+        # Jitter stats
+        jit = np.asarray(jitters, dtype=np.float64)
+        jitter_avg, jitter_min, jitter_max = _stats(jit)
+        
+        # Packet loss stats
+        loss = np.asarray(packet_loss, dtype=np.float64)
+        loss_avg, _, loss_max = _stats(loss)
+        
+        # Response time
+        rt = np.asarray(response_times, dtype=np.float64)
+        rt_avg = _stats(rt)[0]
+        
+        # Flow counts
+        tcp_flows = udp_flows = 0
+        for f in flows:
+            protocol = f.get('protocol')
+            if protocol == 'tcp':
+                tcp_flows += 1
+            elif protocol == 'udp':
+                udp_flows += 1
+        
+        return [
+            data.get('scenario', 'unknown'),
+            data.get('algorithm', 'unknown'),
+            tcp_avg,
+            tcp_min,
+            tcp_max,
+            udp_avg,
+            udp_min,
+            udp_max,
+            delay_avg,
+            delay_min,
+            delay_max,
+            jitter_avg,
+            jitter_min,
+            jitter_max,
+            loss_avg,
+            loss_max,
+            cpu.get('avg', 0),
+            cpu.get('max', 0),
+            cpu.get('min', 0),
+            data.get('fairness_index', 0),
+            rt_avg,
+            len(flows),
+            tcp_flows,
+            udp_flows,
+            data.get('start_time', 'unknown')
+        ]
+    
+    def export_detailed_flows_csv(self, rows):
+        """Export detailed per-flow data to CSV
+        
+        rows: per-flow rows built by flow_row()
+        """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         csv_file = f"{self.export_dir}/detailed_flows_{timestamp}.csv"
         
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow([
-                'Scenario',
-                'Algorithm',
-                'Flow Label',
-                'Source',
-                'Destination',
-                'Protocol',
-                'Throughput (Mbps)',
-                'Jitter (ms)',
-                'Packet Loss (%)',
-                'Test Date'
-            ])
-            
-            # Data rows
-            for filepath in results_files:
-                data = self.load_json(filepath)
-                if not data:
-                    continue
-                
-                scenario = data.get('scenario', 'unknown')
-                algorithm = data.get('algorithm', 'unknown')
-                test_date = data.get('start_time', 'unknown')
-                
-                for flow in data.get('flows', []):
-                    writer.writerow([
-                        scenario,
-                        algorithm,
-                        flow.get('label', 'unknown'),
-                        flow.get('src', 'unknown'),
-                        flow.get('dst', 'unknown'),
-                        flow.get('protocol', 'unknown'),
-                        f"{flow.get('throughput', 0):.2f}",
-                        f"{flow.get('jitter', 0):.4f}",
-                        f"{flow.get('packet_loss', 0):.4f}",
-                        test_date
-                    ])
+        columns = [
+            'Scenario',
+            'Algorithm',
+            'Flow Label',
+            'Source',
+            'Destination',
+            'Protocol',
+            'Throughput (Mbps)',
+            'Jitter (ms)',
+            'Packet Loss (%)',
+            'Test Date'
+        ]
+        self._write_table(
+            csv_file, columns, rows,
+            two_dp=['Throughput (Mbps)'],
+            four_dp=['Jitter (ms)', 'Packet Loss (%)']
+        )
         
         print(f"✅ Detailed flows exported to: {csv_file}")
         return csv_file
     
-    def export_comparison_csv(self, wrr_files, wlc_files):
-        """Export side-by-side comparison of WRR vs WLC"""
+    def flow_row(self, scenario, algorithm, test_date, flow):
+        """Build one detailed-flows CSV row"""
+        return [
+            scenario,
+            algorithm,
+            flow.get('label', 'unknown'),
+            flow.get('src', 'unknown'),
+            flow.get('dst', 'unknown'),
+            flow.get('protocol', 'unknown'),
+            flow.get('throughput', 0),
+            flow.get('jitter', 0),
+            flow.get('packet_loss', 0),
+            test_date
+        ]
+    
+    def export_comparison_csv(self, wrr_by_scenario, wlc_by_scenario):
+        """Export side-by-side comparison of WRR vs WLC
+        
+        wrr_by_scenario, wlc_by_scenario: parsed results keyed by scenario
+        """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         csv_file = f"{self.export_dir}/comparison_wrr_vs_wlc_{timestamp}.csv"
         
-        # Group by scenario
-        wrr_by_scenario = {}
-        wlc_by_scenario = {}
-        
-        for filepath in wrr_files:
-            data = self.load_json(filepath)
-            if data:
-                scenario = data.get('scenario', 'unknown')
-                wrr_by_scenario[scenario] = data
-        
-        for filepath in wlc_files:
-            data = self.load_json(filepath)
-            if data:
-                scenario = data.get('scenario', 'unknown')
-                wlc_by_scenario[scenario] = data
-        
-        with open(csv_file, 'w', newline='') as f:
+        with open(csv_file, 'w', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
             
             # Header
@@ -229,120 +331,97 @@ class ResultsExporter:
                 'Better Algorithm'
             ])
             
-            # Compare each scenario
+            # (label, higher is better, decimals) for each compared metric
+            metrics = [
+                ('TCP Throughput (Mbps)', True, 2),
+                ('Delay (ms)', False, 2),
+                ('Jitter (ms)', False, 4),
+                ('Packet Loss (%)', False, 4),
+                ('CPU Utilization (%)', False, 2),
+                ('Fairness Index', True, 4)
+            ]
+            
+            # Scenarios present for both algorithms
             all_scenarios = set(wrr_by_scenario.keys()) | set(wlc_by_scenario.keys())
+            scenarios = [
+                scenario for scenario in sorted(all_scenarios)
+                if wrr_by_scenario.get(scenario) and wlc_by_scenario.get(scenario)
+            ]
             
-            for scenario in sorted(all_scenarios):
-                wrr_data = wrr_by_scenario.get(scenario)
-                wlc_data = wlc_by_scenario.get(scenario)
-                
-                if not wrr_data or not wlc_data:
-                    continue
-                
-                # TCP Throughput
-                wrr_tcp = wrr_data.get('throughput', {}).get('tcp', [])
-                wlc_tcp = wlc_data.get('throughput', {}).get('tcp', [])
-                if wrr_tcp and wlc_tcp:
-                    wrr_avg = sum(wrr_tcp) / len(wrr_tcp)
-                    wlc_avg = sum(wlc_tcp) / len(wlc_tcp)
-                    diff = wlc_avg - wrr_avg
-                    better = 'WLC' if wlc_avg > wrr_avg else 'WRR'
-                    writer.writerow([
-                        scenario,
-                        'TCP Throughput (Mbps)',
-                        f"{wrr_avg:.2f}",
-                        f"{wlc_avg:.2f}",
-                        f"{diff:+.2f}",
-                        better
-                    ])
-                
-                # Delay
-                wrr_delay = wrr_data.get('delay', [])
-                wlc_delay = wlc_data.get('delay', [])
-                if wrr_delay and wlc_delay:
-                    wrr_avg = sum(d['avg'] for d in wrr_delay) / len(wrr_delay)
-                    wlc_avg = sum(d['avg'] for d in wlc_delay) / len(wlc_delay)
-                    diff = wlc_avg - wrr_avg
-                    better = 'WRR' if wrr_avg < wlc_avg else 'WLC'  # Lower is better
-                    writer.writerow([
-                        scenario,
-                        'Delay (ms)',
-                        f"{wrr_avg:.2f}",
-                        f"{wlc_avg:.2f}",
-                        f"{diff:+.2f}",
-                        better
-                    ])
-                
-                # Jitter
-                wrr_jitter = wrr_data.get('jitter', [])
-                wlc_jitter = wlc_data.get('jitter', [])
-                if wrr_jitter and wlc_jitter:
-                    wrr_avg = sum(wrr_jitter) / len(wrr_jitter)
-                    wlc_avg = sum(wlc_jitter) / len(wlc_jitter)
-                    diff = wlc_avg - wrr_avg
-                    better = 'WRR' if wrr_avg < wlc_avg else 'WLC'  # Lower is better
-                    writer.writerow([
-                        scenario,
-                        'Jitter (ms)',
-                        f"{wrr_avg:.4f}",
-                        f"{wlc_avg:.4f}",
-                        f"{diff:+.4f}",
-                        better
-                    ])
-                
-                # Packet Loss
-                wrr_loss = wrr_data.get('packet_loss', [])
-                wlc_loss = wlc_data.get('packet_loss', [])
-                if wrr_loss and wlc_loss:
-                    wrr_avg = sum(wrr_loss) / len(wrr_loss)
-                    wlc_avg = sum(wlc_loss) / len(wlc_loss)
-                    diff = wlc_avg - wrr_avg
-                    better = 'WRR' if wrr_avg < wlc_avg else 'WLC'  # Lower is better
-                    writer.writerow([
-                        scenario,
-                        'Packet Loss (%)',
-                        f"{wrr_avg:.4f}",
-                        f"{wlc_avg:.4f}",
-                        f"{diff:+.4f}",
-                        better
-                    ])
-                
-                # CPU
-                wrr_cpu = wrr_data.get('cpu_utilization', {}).get('avg', 0)
-                wlc_cpu = wlc_data.get('cpu_utilization', {}).get('avg', 0)
-                if wrr_cpu > 0 and wlc_cpu > 0:
-                    diff = wlc_cpu - wrr_cpu
-                    better = 'WRR' if wrr_cpu < wlc_cpu else 'WLC'  # Lower is better
-                    writer.writerow([
-                        scenario,
-                        'CPU Utilization (%)',
-                        f"{wrr_cpu:.2f}",
-                        f"{wlc_cpu:.2f}",
-                        f"{diff:+.2f}",
-                        better
-                    ])
-                
-                # Fairness
-                wrr_fair = wrr_data.get('fairness_index', 0)
-                wlc_fair = wlc_data.get('fairness_index', 0)
-                if wrr_fair > 0 and wlc_fair > 0:
-                    diff = wlc_fair - wrr_fair
-                    better = 'WLC' if wlc_fair > wrr_fair else 'WRR'  # Higher is better
-                    writer.writerow([
-                        scenario,
-                        'Fairness Index',
-                        f"{wrr_fair:.4f}",
-                        f"{wlc_fair:.4f}",
-                        f"{diff:+.4f}",
-                        better
-                    ])
+            # (n_scenarios, n_metrics) matrices, NaN where a metric is missing
+            wrr = np.array(
+                [self._comparison_values(wrr_by_scenario[s]) for s in scenarios],
+                dtype=np.float64
+            ).reshape(-1, len(metrics))
+            wlc = np.array(
+                [self._comparison_values(wlc_by_scenario[s]) for s in scenarios],
+                dtype=np.float64
+            ).reshape(-1, len(metrics))
+            
+            diff = wlc - wrr
+            valid = ~(np.isnan(wrr) | np.isnan(wlc))
+            higher_is_better = np.array([m[1] for m in metrics])
+            better = np.where(
+                higher_is_better,
+                np.where(wlc > wrr, 'WLC', 'WRR'),
+                np.where(wrr < wlc, 'WRR', 'WLC')
+            )
+            
+            # Compare each scenario
+            rows = []
+            for i, scenario in enumerate(scenarios):
+                for j, (label, _, decimals) in enumerate(metrics):
+                    if valid[i, j]:
+                        rows.append([
+                            scenario,
+                            label,
+                            f"{wrr[i, j]:.{decimals}f}",
+                            f"{wlc[i, j]:.{decimals}f}",
+                            f"{diff[i, j]:+.{decimals}f}",
+                            better[i, j]
+                        ])
                 
                 # Add blank row between scenarios
-                writer.writerow([])
+                rows.append([])
+            
+            writer.writerows(rows)
         
         print(f"✅ Comparison exported to: {csv_file}")
         return csv_file
     
+    def _comparison_values(self, data):
+        """Per-metric values compared between WRR and WLC (NaN when missing)"""
+        tcp = (data.get('throughput') or {}).get('tcp') or []
+        delays = data.get('delay') or []
+        jitters = data.get('jitter') or []
+        packet_loss = data.get('packet_loss') or []
+        cpu = (data.get('cpu_utilization') or {}).get('avg', 0)
+        fairness = data.get('fairness_index', 0)
+        
+        return (
+            np.mean(tcp) if tcp else np.nan,
+            np.mean([d['avg'] for d in delays]) if delays else np.nan,
+            np.mean(jitters) if jitters else np.nan,
+            np.mean(packet_loss) if packet_loss else np.nan,
+            cpu if cpu > 0 else np.nan,
+            fairness if fairness > 0 else np.nan
+        )
+    
+    def _process_one(self, data):
+        """Build every exporter's rows for one parsed result file
+        
+        Returns (summary_row, flow_rows, scenario).
+        """
+        scenario = data.get('scenario', 'unknown')
+        algorithm = data.get('algorithm', 'unknown')
+        test_date = data.get('start_time', 'unknown')
+        
+        flow_rows = [
+            self.flow_row(scenario, algorithm, test_date, flow)
+            for flow in data.get('flows', [])
+        ]
+        return self.summary_row(data), flow_rows, scenario
+    
     def export_all(self):
         """Export all formats"""
         print("\n" + "="*70)
@@ -359,25 +438,50 @@ class ResultsExporter:
         
         print(f"Found {len(all_files)} result file(s)\n")
         
-        # Separate WRR and WLC files
-        wrr_files = [f for f in all_files if '/wrr/' in f]
-        wlc_files = [f for f in all_files if '/wlc/' in f]
+        # Read and parse every file once, in parallel, and share the
+        # parsed data with all exporters
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+            parsed = list(ex.map(self.load_json, all_files))
+        
+        # Single pass over the parsed files: build the summary and flow
+        # rows and group WRR/WLC results by scenario at the same time
+        summary_rows = []
+        flow_rows = []
+        wrr_by_scenario = {}
+        wlc_by_scenario = {}
+        wrr_count = wlc_count = 0
+        
+        for filepath, data in zip(all_files, parsed):
+            if not data:
+                continue
+            
+            summary_row, rows, scenario = self._process_one(data)
+            summary_rows.append(summary_row)
+            flow_rows.extend(rows)
+            
+            # Separate WRR and WLC files
+            if '/wrr/' in filepath:
+                wrr_by_scenario[scenario] = data
+                wrr_count += 1
+            elif '/wlc/' in filepath:
+                wlc_by_scenario[scenario] = data
+                wlc_count += 1
         
-        print(f"  • WRR results: {len(wrr_files)}")
-        print(f"  • WLC results: {len(wlc_files)}\n")
+        print(f"  • WRR results: {wrr_count}")
+        print(f"  • WLC results: {wlc_count}\n")
         
         # Export summary
         print("1️⃣  Exporting summary...")
-        self.export_summary_csv(all_files)
+        self.export_summary_csv(summary_rows)
         
         # Export detailed flows
         print("\n2️⃣  Exporting detailed flows...")
-        self.export_detailed_flows_csv(all_files)
+        self.export_detailed_flows_csv(flow_rows)
         
         # Export comparison if both WRR and WLC exist
-        if wrr_files and wlc_files:
+        if wrr_by_scenario and wlc_by_scenario:
             print("\n3️⃣  Exporting WRR vs WLC comparison...")
-            self.export_comparison_csv(wrr_files, wlc_files)
+            self.export_comparison_csv(wrr_by_scenario, wlc_by_scenario)
         else:
             print("\n⚠️  Skipping comparison (need both WRR and WLC results)")
         
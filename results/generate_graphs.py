@@ -1,23 +1,173 @@
-import json
 import os
 import glob
-import matplotlib.pyplot as plt
+import pickle
+import hashlib
+import multiprocessing
 import matplotlib
+# Select the non-interactive backend before pyplot is imported, so no GUI
+# backend is probed
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from matplotlib.ticker import FixedLocator, FixedFormatter
 
-# Set matplotlib backend and style
-matplotlib.use('Agg')
-plt.style.use('seaborn-v0_8-darkgrid')
+# Prefer a faster JSON parser when one is installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    try:
+        from ujson import loads as _loads
+    except ImportError:
+        from json import loads as _loads
+
+# Stream only the 'metrics' subtree of aggregated files when ijson is
+# installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Encode PNGs straight from the Agg buffer when imageio is installed
+try:
+    import imageio.v3 as iio
+except ImportError:
+    iio = None
+
+# Resolved 'seaborn-v0_8-darkgrid' style, installed without parsing the
+# style file
+_FROZEN_STYLE = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': 'white',
+    'axes.facecolor': '#EAEAF2',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.linewidth': 0.0,
+    'figure.facecolor': 'white',
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': 'white',
+    'grid.linestyle': '-',
+    'image.cmap': 'Greys',
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'lines.solid_capstyle': 'round',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.major.size': 0.0,
+    'xtick.minor.size': 0.0,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.major.size': 0.0,
+    'ytick.minor.size': 0.0
+}
+
+# Set matplotlib style; text is always rendered by matplotlib, never LaTeX
+plt.rcParams.update(_FROZEN_STYLE)
+plt.rcParams['text.usetex'] = False
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 11
 
+# Metric types understood by GraphGenerator.extract_metric
+METRIC_TYPES = [
+    'tcp_throughput',
+    'udp_throughput',
+    'delay',
+    'jitter',
+    'packet_loss',
+    'cpu',
+    'fairness_index',
+    'response_time'
+]
+
+# run_repeated_experiments names aggregated files by these short keys
+# (<key>_aggregated.json); the results themselves use the long names
+AGGREGATED_SCENARIOS = {
+    'office': 'voip_video_data_mix',
+    'streaming': 'live_streaming',
+    'elephant': 'elephant_mice',
+    'mixed': 'mixed_load'
+}
+
+# savefig settings: quick-look default, and publication quality (high_dpi)
+SAVE_KW = dict(dpi=150, bbox_inches=None)
+SAVE_KW_HIGH_DPI = dict(dpi=300, bbox_inches='tight')
+
+# Graph methods in output order, drawn by GraphGenerator.generate_all
+GRAPH_METHODS = [
+    'graph_throughput_comparison',
+    'graph_delay_jitter',
+    'graph_fairness_cpu',
+    'graph_packet_loss_response_time',
+    'graph_performance_radar',
+    'graph_summary_table',
+    'graph_correlation',
+    'graph_overall_performance_score',
+    'graph_throughput_vs_load',
+    'graph_delay_vs_load',
+    'graph_cpu_vs_load',
+    'graph_fairness_vs_load'
+]
+
+# Graphs 1-4: (progress message, (left, right) panels, filename), each
+# panel being (metric_type, ylabel, title)
+PANELS = [
+    ('[1/12] Generating Throughput Comparison...',
+     (('tcp_throughput', 'Throughput (Mbps)', 'TCP Throughput Comparison'),
+      ('udp_throughput', 'Throughput (Mbps)', 'UDP Throughput Comparison')),
+     '1_throughput_comparison.png'),
+    ('[2/12] Generating Delay & Jitter Comparison...',
+     (('delay', 'Delay (ms)', 'Average RTT Delay'),
+      ('jitter', 'Jitter (ms)', 'Average Jitter')),
+     '2_delay_jitter_comparison.png'),
+    ('[3/12] Generating Fairness & CPU Comparison...',
+     (('fairness_index', 'Fairness Index', 'Fairness Index'),
+      ('cpu', 'CPU Utilization (%)', 'CPU Utilization')),
+     '3_fairness_cpu_comparison.png'),
+    ('[4/12] Generating Packet Loss & Response Time...',
+     (('packet_loss', 'Packet Loss (%)', 'Packet Loss'),
+      ('response_time', 'Response Time (ms)', 'Response Time')),
+     '4_packet_loss_response_time.png')
+]
+
+# (GraphGenerator, results) inherited by forked render workers
+_render_state = None
+
+
+def _render_graph(name):
+    """Pool worker: draw one graph from the state inherited at fork"""
+    gg, results = _render_state
+    gg._render_if_changed(name, results)
+
+
+# Per-scenario record of one metric for both algorithms
+METRIC_DTYPE = np.dtype([
+    ('wrr_mean', 'f8'),
+    ('wrr_std', 'f8'),
+    ('wlc_mean', 'f8'),
+    ('wlc_std', 'f8')
+])
+
 
 class GraphGenerator:
     """Generate various graphs from test results"""
     
-    def __init__(self, use_aggregated=False):
+    def __init__(self, use_aggregated=False, high_dpi=False, scenario_filter=None,
+                 output_format='png'):
         self.use_aggregated = use_aggregated
+        # Only load these scenarios (None = all)
+        self.scenario_filter = scenario_filter
+        self.save_kw = SAVE_KW_HIGH_DPI if high_dpi else SAVE_KW
+        # Figures reused across graphs with the same layout
+        self._fig_pool = {}
+        # Results last loaded, their input signature, and the last file saved
+        self._results = None
+        self._signature = None
+        self._saved = None
         
         if use_aggregated:
             self.results_dir = "results/aggregated"
@@ -26,51 +176,192 @@ class GraphGenerator:
             self.results_dir = "results/comprehensive"
             self.graphs_dir = "results/graphs"
         
+        self.cache_dir = "results/.cache"
         os.makedirs(self.graphs_dir, exist_ok=True)
         
+        # output_format='pdf': every graph becomes a page of one PDF
+        self.output_format = output_format
+        self._pdf = None
+        if output_format == 'pdf':
+            from matplotlib.backends.backend_pdf import PdfPages
+            self._pdf_path = f"{self.graphs_dir}/all_graphs.pdf"
+            self._pdf = PdfPages(self._pdf_path)
+        
         self.colors = {
             'wrr': '#FBD9CD',
             'wlc': '#7A958F'
         }
     
-    def load_all_results(self):
-        """Load all result files"""
+    def load_all_results(self, metrics=None, scenarios=None):
+        """Load all result files
+        
+        metrics: metric types to extract (default: all METRIC_TYPES); graphs
+                 reading other metrics need the default
+        scenarios: scenarios to load (default: self.scenario_filter, or all);
+                   short aggregated keys ('mixed') mean their long names
+        """
         results = {'wrr': {}, 'wlc': {}}
+        self._metric_types = list(metrics) if metrics else METRIC_TYPES
+        scenarios = scenarios or self.scenario_filter
+        wanted = {AGGREGATED_SCENARIOS.get(s, s) for s in scenarios} if scenarios else None
         
         if self.use_aggregated:
+            files = []
             for algorithm in ['wrr', 'wlc']:
                 agg_dir = f"{self.results_dir}/{algorithm}"
                 if os.path.exists(agg_dir):
                     pattern = f"{agg_dir}/*_aggregated.json"
-                    files = glob.glob(pattern)
-                    
-                    for filepath in files:
-                        try:
-                            with open(filepath, 'r') as f:
-                                data = json.load(f)
-                            scenario = data.get('scenario', 'unknown')
-                            results[algorithm][scenario] = data
-                        except:
-                            continue
+                    files.extend(
+                        (algorithm, fp) for fp in glob.glob(pattern)
+                        if wanted is None
+                        or self._aggregated_scenario(fp) in wanted
+                    )
         else:
             pattern = f"{self.results_dir}/**/*.json"
-            files = glob.glob(pattern, recursive=True)
-            
-            for filepath in files:
+            files = [(None, fp) for fp in glob.glob(pattern, recursive=True)]
+        
+        # Reuse the results parsed by an earlier run if no input changed.
+        # One pickle is kept per slot (mode + scenario filter), so normal,
+        # aggregated and filtered runs do not evict each other
+        self._signature = self._files_signature(files, wanted)
+        slot = os.path.basename(self.results_dir)
+        slot += '_' + ('+'.join(sorted(wanted)) if wanted is not None else 'all')
+        cache_file = f"{self.cache_dir}/{slot}-{self._signature}.pkl"
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'rb') as f:
+                    results = pickle.load(f)
+                self._index_results(results)
+                return results
+            except:
+                pass
+        
+        # Parse files concurrently; results are applied in glob order
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            load = self._load_aggregated if self.use_aggregated else self._load_json
+            loaded = ex.map(load, [fp for _, fp in files])
+            
+            for (algorithm, filepath), data in zip(files, loaded):
+                if data is None:
+                    continue
+                
                 try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    
-                    algorithm = data.get('algorithm', 'unknown')
+                    if algorithm is None:
+                        algorithm = data.get('algorithm', 'unknown')
                     scenario = data.get('scenario', 'unknown')
                     
+                    if wanted is not None and scenario not in wanted:
+                        continue
                     if algorithm in results:
                         results[algorithm][scenario] = data
                 except:
                     continue
         
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Only the newest inputs are worth keeping; drop this slot's
+            # stale pickles
+            for stale in glob.glob(f"{self.cache_dir}/{glob.escape(slot)}-*.pkl"):
+                if stale != cache_file and os.path.basename(stale).rsplit('-', 1)[0] == slot:
+                    os.remove(stale)
+        except OSError:
+            pass
+        
+        self._index_results(results)
         return results
     
+    def _files_signature(self, files, wanted=None):
+        """Hash of (algorithm, path, mtime, size) for every input file"""
+        entries = [('scenarios', sorted(wanted))] if wanted is not None else []
+        for algorithm, filepath in files:
+            st = os.stat(filepath)
+            entries.append((algorithm or '', filepath, st.st_mtime_ns, st.st_size))
+        return hashlib.blake2b(repr(sorted(entries)).encode(), digest_size=16).hexdigest()
+    
+    def _load_json(self, filepath):
+        """Load one JSON file, or None if it cannot be read"""
+        try:
+            with open(filepath, 'rb') as f:
+                return _loads(f.read())
+        except:
+            return None
+    
+    def _load_aggregated(self, filepath):
+        """Load the scenario and metrics of one aggregated file, or None
+        
+        With ijson the top-level keys are read up to 'metrics' and the
+        per-run data after it is skipped. The scenario is the file's own
+        'scenario' value, as without ijson.
+        """
+        if ijson is None:
+            return self._load_json(filepath)
+        data = {}
+        try:
+            with open(filepath, 'rb') as f:
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    data[key] = value
+                    if key == 'metrics':
+                        break
+        except:
+            return None
+        return data
+    
+    def _aggregated_scenario(self, filepath):
+        """Long scenario name of a <key>_aggregated.json file"""
+        key = os.path.basename(filepath)[:-len('_aggregated.json')]
+        return AGGREGATED_SCENARIOS.get(key, key)
+    
+    def _index_results(self, results):
+        """Precompute the per-metric data shared by all graphs"""
+        self._results = results
+        # Sorted union of the scenarios run with either algorithm
+        self._all_scenarios = sorted(set(results['wrr'].keys()) | set(results['wlc'].keys()))
+        self._labels = {s: s.replace('_', ' ').title() for s in self._all_scenarios}
+        
+        # Sorted (scenario, wrr_data, wlc_data) for scenarios with non-empty
+        # results for both algorithms
+        wrr_keys = np.array(list(results['wrr']), dtype=str)
+        wlc_keys = np.array(list(results['wlc']), dtype=str)
+        self._paired = []
+        for scenario in np.intersect1d(wrr_keys, wlc_keys).tolist():
+            wrr_data = results['wrr'][scenario]
+            wlc_data = results['wlc'][scenario]
+            if wrr_data and wlc_data:
+                self._paired.append((scenario, wrr_data, wlc_data))
+        self._common = [scenario for scenario, _, _ in self._paired]
+        self._build_metric_cache(results)
+        self._metrics = self._build_metric_matrix(results)
+    
+    def _build_metric_cache(self, results):
+        """Extract every metric once per (algorithm, scenario)"""
+        cache = {}
+        for algorithm, scenarios in results.items():
+            for scenario, data in scenarios.items():
+                for metric_type in self._metric_types:
+                    cache[(algorithm, scenario, metric_type)] = self.extract_metric(data, metric_type)
+        self._metric_cache = MappingProxyType(cache)
+    
+    def _build_metric_matrix(self, results):
+        """Per-metric arrays over scenarios run with both algorithms
+        
+        Returns {'scenarios': [labels], metric_type: array} where each
+        array has the METRIC_DTYPE fields, one element per scenario.
+        """
+        common = self._common
+        
+        matrix = {'scenarios': [self._labels[scenario] for scenario in common]}
+        for metric_type in self._metric_types:
+            arr = np.empty(len(common), dtype=METRIC_DTYPE)
+            for i, scenario in enumerate(common):
+                arr[i] = (
+                    self._metric_cache[('wrr', scenario, metric_type)]
+                    + self._metric_cache[('wlc', scenario, metric_type)]
+                )
+            matrix[metric_type] = arr
+        return matrix
+    
     def extract_metric(self, data, metric_type):
         """Extract metric value and std from data"""
         if self.use_aggregated:
@@ -82,336 +373,217 @@ class GraphGenerator:
         else:
             if metric_type == 'tcp_throughput':
                 tcp = data.get('throughput', {}).get('tcp', [])
-                val = sum(tcp) / len(tcp) if tcp else 0
+                val = float(np.asarray(tcp, dtype=np.float64).mean()) if tcp else 0
             elif metric_type == 'udp_throughput':
                 udp = data.get('throughput', {}).get('udp', [])
-                val = sum(udp) / len(udp) if udp else 0
+                val = float(np.asarray(udp, dtype=np.float64).mean()) if udp else 0
             elif metric_type == 'delay':
                 delays = data.get('delay', [])
-                val = sum(d['avg'] for d in delays) / len(delays) if delays else 0
+                arr = np.fromiter((d['avg'] for d in delays), dtype=np.float64, count=len(delays))
+                val = float(arr.mean()) if arr.size else 0
             elif metric_type == 'jitter':
                 jitters = data.get('jitter', [])
-                val = sum(jitters) / len(jitters) if jitters else 0
+                val = float(np.asarray(jitters, dtype=np.float64).mean()) if jitters else 0
             elif metric_type == 'packet_loss':
                 losses = data.get('packet_loss', [])
-                val = sum(losses) / len(losses) if losses else 0
+                val = float(np.asarray(losses, dtype=np.float64).mean()) if losses else 0
             elif metric_type == 'cpu':
                 val = data.get('cpu_utilization', {}).get('avg', 0)
             elif metric_type == 'fairness_index':
                 val = data.get('fairness_index', 0)
             elif metric_type == 'response_time':
                 rts = data.get('response_time', [])
-                val = sum(rts) / len(rts) if rts else 0
+                val = float(np.asarray(rts, dtype=np.float64).mean()) if rts else 0
             else:
                 val = 0
             
             return val, 0
     
-    def graph_throughput_comparison(self, results):
-        """Graph 1: Throughput Comparison with error bars"""
-        print("\n[1/12] Generating Throughput Comparison...")
+    def generate_all(self, results):
+        """Draw every graph, rendering them in parallel worker processes"""
+        global _render_state
+        
+        try:
+            # Pages of a single PDF must be written by this process
+            if self._pdf is not None:
+                raise ValueError('pdf output')
+            ctx = multiprocessing.get_context('fork')
+        except ValueError:
+            # No fork on this platform (or PDF output): draw sequentially
+            for name in GRAPH_METHODS:
+                self._render_if_changed(name, results)
+            self.close_all()
+            return
         
-        scenarios = []
-        wrr_tcp_means, wrr_tcp_stds = [], []
-        wlc_tcp_means, wlc_tcp_stds = [], []
-        wrr_udp_means, wrr_udp_stds = [], []
-        wlc_udp_means, wlc_udp_stds = [], []
+        _render_state = (self, results)
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(GRAPH_METHODS), os.cpu_count() or 1),
+                                     mp_context=ctx) as ex:
+                list(ex.map(_render_graph, GRAPH_METHODS))
+        finally:
+            _render_state = None
+    
+    def _graph_key(self, name):
+        """Hash of everything graph name's output depends on
+        
+        The input files (via the load signature), the settings and this
+        module's source.
+        """
+        state = (name, self._signature, self._metric_types, self.use_aggregated,
+                 self.save_kw, os.stat(__file__).st_mtime_ns)
+        return hashlib.blake2b(repr(state).encode(), digest_size=16).hexdigest()
+    
+    def _render_if_changed(self, name, results):
+        """Draw graph name unless its last output is up to date
+        
+        A sidecar .<name>.hash in graphs_dir records the input hash and the
+        file written. PDF pages are always drawn.
+        """
+        if self._pdf is not None or results is not self._results:
+            getattr(self, name)(results)
+            return
         
-        all_scenarios = set(results['wrr'].keys()) | set(results['wlc'].keys())
+        key = self._graph_key(name)
+        stamp = f"{self.graphs_dir}/.{name}.hash"
+        try:
+            with open(stamp) as f:
+                old_key, filepath = f.read().split('\n', 1)
+            if old_key == key and os.path.exists(filepath):
+                print(f"\n{name}: unchanged, kept {filepath}")
+                return
+        except (OSError, ValueError):
+            pass
+        
+        self._saved = None
+        getattr(self, name)(results)
+        if self._saved is not None:
+            with open(stamp, 'w') as f:
+                f.write(f"{key}\n{self._saved}")
+    
+    def _bar_pair(self, ax, x, width, series):
+        """Draw WRR and WLC bars with error bars in a single ax.bar call
+        
+        series: metric array with METRIC_DTYPE fields, one per scenario
+        """
+        n = len(x)
+        bars = ax.bar(
+            np.concatenate([x - width/2, x + width/2]),
+            np.concatenate([series['wrr_mean'], series['wlc_mean']]),
+            width,
+            yerr=np.concatenate([series['wrr_std'], series['wlc_std']]),
+            color=[self.colors['wrr']] * n + [self.colors['wlc']] * n,
+            alpha=0.8,
+            capsize=5
+        )
+        # Label one bar per algorithm so ax.legend() shows WRR and WLC
+        if n:
+            bars.patches[0].set_label('WRR')
+            bars.patches[n].set_label('WLC')
+    
+    def _set_xlabels(self, ax, x, labels):
+        """Put rotated scenario labels at positions x with a fixed locator"""
+        ax.xaxis.set_major_locator(FixedLocator(x))
+        ax.xaxis.set_major_formatter(FixedFormatter(labels))
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    
+    def _pooled_figure(self, key, create, size=None):
+        """Return the reusable (fig, axes) for key with its axes cleared
+        
+        create() builds the figure the first time key is requested;
+        size (inches) resizes a figure shared by graphs of different sizes.
+        """
+        if key not in self._fig_pool:
+            self._fig_pool[key] = create()
+        fig, axes = self._fig_pool[key]
+        for ax in np.atleast_1d(axes):
+            ax.clear()
+        if size is not None:
+            fig.set_size_inches(size)
+        plt.figure(fig.number)
+        return fig, axes
+    
+    def close_all(self):
+        """Close the pooled figures"""
+        for fig, _ in self._fig_pool.values():
+            plt.close(fig)
+        self._fig_pool = {}
+    
+    def finalize(self):
+        """Close the multipage PDF (if any) and the pooled figures"""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        self.close_all()
+    
+    def _save(self, filepath):
+        """Save the current figure to filepath and return where it went
+        
+        In PDF mode the figure is appended as a page of all_graphs.pdf.
+        """
+        fig = plt.gcf()
+        if self._pdf is not None:
+            self._pdf.savefig(fig, bbox_inches=self.save_kw['bbox_inches'])
+            return f"{self._pdf_path} (page {self._pdf.get_pagecount()})"
+        if iio is not None and self.save_kw['bbox_inches'] is None:
+            # No tight bbox to compute: encode the rendered canvas directly
+            fig.set_dpi(self.save_kw['dpi'])
+            fig.canvas.draw()
+            iio.imwrite(filepath, np.asarray(fig.canvas.buffer_rgba()))
+        else:
+            plt.savefig(filepath, **self.save_kw)
+        self._saved = filepath
+        return filepath
+    
+    def _two_panel_bar(self, metrics, progress, panels, filename):
+        """Draw two WRR/WLC bar panels side by side (graphs 1-4)
         
-        for scenario in sorted(all_scenarios):
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_tcp_mean, wrr_tcp_std = self.extract_metric(wrr_data, 'tcp_throughput')
-            wlc_tcp_mean, wlc_tcp_std = self.extract_metric(wlc_data, 'tcp_throughput')
-            wrr_tcp_means.append(wrr_tcp_mean)
-            wrr_tcp_stds.append(wrr_tcp_std)
-            wlc_tcp_means.append(wlc_tcp_mean)
-            wlc_tcp_stds.append(wlc_tcp_std)
-            
-            wrr_udp_mean, wrr_udp_std = self.extract_metric(wrr_data, 'udp_throughput')
-            wlc_udp_mean, wlc_udp_std = self.extract_metric(wlc_data, 'udp_throughput')
-            wrr_udp_means.append(wrr_udp_mean)
-            wrr_udp_stds.append(wrr_udp_std)
-            wlc_udp_means.append(wlc_udp_mean)
-            wlc_udp_stds.append(wlc_udp_std)
+        metrics: metric matrix from _build_metric_matrix
+        panels: two (metric_type, ylabel, title) tuples, left then right
+        """
+        print(f"\n{progress}")
         
+        scenarios = metrics['scenarios']
         if not scenarios:
             print("   No data available")
             return
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, axes = self._pooled_figure('1x2', lambda: plt.subplots(1, 2, figsize=(16, 6)))
         
         x = np.arange(len(scenarios))
         width = 0.35
         
-        # TCP Throughput
-        ax1.bar(x - width/2, wrr_tcp_means, width, yerr=wrr_tcp_stds, 
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax1.bar(x + width/2, wlc_tcp_means, width, yerr=wlc_tcp_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax1.set_xlabel('Scenario')
-        ax1.set_ylabel('Throughput (Mbps)')
-        ax1.set_title('TCP Throughput Comparison' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax1.legend()
-        ax1.grid(axis='y', alpha=0.3)
-        
-        # UDP Throughput
-        ax2.bar(x - width/2, wrr_udp_means, width, yerr=wrr_udp_stds,
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax2.bar(x + width/2, wlc_udp_means, width, yerr=wlc_udp_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax2.set_xlabel('Scenario')
-        ax2.set_ylabel('Throughput (Mbps)')
-        ax2.set_title('UDP Throughput Comparison' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax2.legend()
-        ax2.grid(axis='y', alpha=0.3)
+        for ax, (metric_type, ylabel, title) in zip(axes, panels):
+            self._bar_pair(ax, x, width, metrics[metric_type])
+            ax.set_xlabel('Scenario')
+            ax.set_ylabel(ylabel)
+            ax.set_title(title + (' (Mean ± SD)' if self.use_aggregated else ''))
+            self._set_xlabels(ax, x, scenarios)
+            if metric_type == 'fairness_index':
+                ax.set_ylim([0, 1.1])
+                ax.axhline(y=1.0, color='green', linestyle='--', alpha=0.3, label='Perfect')
+            ax.legend()
+            ax.grid(axis='y', alpha=0.3)
         
         plt.tight_layout()
-        filepath = f"{self.graphs_dir}/1_throughput_comparison.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = f"{self.graphs_dir}/{filename}"
+        filepath = self._save(filepath)
         print(f"   Saved: {filepath}")
     
+    def graph_throughput_comparison(self, results):
+        """Graph 1: Throughput Comparison with error bars"""
+        self._two_panel_bar(self._metrics, *PANELS[0])
+    
     def graph_delay_jitter(self, results):
         """Graph 2: Delay and Jitter with error bars"""
-        print("\n[2/12] Generating Delay & Jitter Comparison...")
-        
-        scenarios = []
-        wrr_delay_means, wrr_delay_stds = [], []
-        wlc_delay_means, wlc_delay_stds = [], []
-        wrr_jitter_means, wrr_jitter_stds = [], []
-        wlc_jitter_means, wlc_jitter_stds = [], []
-        
-        all_scenarios = set(results['wrr'].keys()) | set(results['wlc'].keys())
-        
-        for scenario in sorted(all_scenarios):
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_d_mean, wrr_d_std = self.extract_metric(wrr_data, 'delay')
-            wlc_d_mean, wlc_d_std = self.extract_metric(wlc_data, 'delay')
-            wrr_delay_means.append(wrr_d_mean)
-            wrr_delay_stds.append(wrr_d_std)
-            wlc_delay_means.append(wlc_d_mean)
-            wlc_delay_stds.append(wlc_d_std)
-            
-            wrr_j_mean, wrr_j_std = self.extract_metric(wrr_data, 'jitter')
-            wlc_j_mean, wlc_j_std = self.extract_metric(wlc_data, 'jitter')
-            wrr_jitter_means.append(wrr_j_mean)
-            wrr_jitter_stds.append(wrr_j_std)
-            wlc_jitter_means.append(wlc_j_mean)
-            wlc_jitter_stds.append(wlc_j_std)
-        
-        if not scenarios:
-            print("   No data available")
-            return
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-        
-        x = np.arange(len(scenarios))
-        width = 0.35
-        
-        # Delay
-        ax1.bar(x - width/2, wrr_delay_means, width, yerr=wrr_delay_stds,
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax1.bar(x + width/2, wlc_delay_means, width, yerr=wlc_delay_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax1.set_xlabel('Scenario')
-        ax1.set_ylabel('Delay (ms)')
-        ax1.set_title('Average RTT Delay' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax1.legend()
-        ax1.grid(axis='y', alpha=0.3)
-        
-        # Jitter
-        ax2.bar(x - width/2, wrr_jitter_means, width, yerr=wrr_jitter_stds,
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax2.bar(x + width/2, wlc_jitter_means, width, yerr=wlc_jitter_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax2.set_xlabel('Scenario')
-        ax2.set_ylabel('Jitter (ms)')
-        ax2.set_title('Average Jitter' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax2.legend()
-        ax2.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
-        filepath = f"{self.graphs_dir}/2_delay_jitter_comparison.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   Saved: {filepath}")
+        self._two_panel_bar(self._metrics, *PANELS[1])
     
     def graph_fairness_cpu(self, results):
         """Graph 3: Fairness and CPU with error bars"""
-        print("\n[3/12] Generating Fairness & CPU Comparison...")
-        
-        scenarios = []
-        wrr_fair_means, wrr_fair_stds = [], []
-        wlc_fair_means, wlc_fair_stds = [], []
-        wrr_cpu_means, wrr_cpu_stds = [], []
-        wlc_cpu_means, wlc_cpu_stds = [], []
-        
-        all_scenarios = set(results['wrr'].keys()) | set(results['wlc'].keys())
-        
-        for scenario in sorted(all_scenarios):
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_f_mean, wrr_f_std = self.extract_metric(wrr_data, 'fairness_index')
-            wlc_f_mean, wlc_f_std = self.extract_metric(wlc_data, 'fairness_index')
-            wrr_fair_means.append(wrr_f_mean)
-            wrr_fair_stds.append(wrr_f_std)
-            wlc_fair_means.append(wlc_f_mean)
-            wlc_fair_stds.append(wlc_f_std)
-            
-            wrr_c_mean, wrr_c_std = self.extract_metric(wrr_data, 'cpu')
-            wlc_c_mean, wlc_c_std = self.extract_metric(wlc_data, 'cpu')
-            wrr_cpu_means.append(wrr_c_mean)
-            wrr_cpu_stds.append(wrr_c_std)
-            wlc_cpu_means.append(wlc_c_mean)
-            wlc_cpu_stds.append(wlc_c_std)
-        
-        if not scenarios:
-            print("   No data available")
-            return
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-        
-        x = np.arange(len(scenarios))
-        width = 0.35
-        
-        # Fairness
-        ax1.bar(x - width/2, wrr_fair_means, width, yerr=wrr_fair_stds,
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax1.bar(x + width/2, wlc_fair_means, width, yerr=wlc_fair_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax1.set_xlabel('Scenario')
-        ax1.set_ylabel('Fairness Index')
-        ax1.set_title('Fairness Index' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax1.set_ylim([0, 1.1])
-        ax1.axhline(y=1.0, color='green', linestyle='--', alpha=0.3, label='Perfect')
-        ax1.legend()
-        ax1.grid(axis='y', alpha=0.3)
-        
-        # CPU
-        ax2.bar(x - width/2, wrr_cpu_means, width, yerr=wrr_cpu_stds,
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax2.bar(x + width/2, wlc_cpu_means, width, yerr=wlc_cpu_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax2.set_xlabel('Scenario')
-        ax2.set_ylabel('CPU Utilization (%)')
-        ax2.set_title('CPU Utilization' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax2.legend()
-        ax2.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
-        filepath = f"{self.graphs_dir}/3_fairness_cpu_comparison.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   Saved: {filepath}")
+        self._two_panel_bar(self._metrics, *PANELS[2])
     
     def graph_packet_loss_response_time(self, results):
         """Graph 4: Packet Loss and Response Time with error bars"""
-        print("\n[4/12] Generating Packet Loss & Response Time...")
-        
-        scenarios = []
-        wrr_loss_means, wrr_loss_stds = [], []
-        wlc_loss_means, wlc_loss_stds = [], []
-        wrr_rt_means, wrr_rt_stds = [], []
-        wlc_rt_means, wlc_rt_stds = [], []
-        
-        all_scenarios = set(results['wrr'].keys()) | set(results['wlc'].keys())
-        
-        for scenario in sorted(all_scenarios):
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_l_mean, wrr_l_std = self.extract_metric(wrr_data, 'packet_loss')
-            wlc_l_mean, wlc_l_std = self.extract_metric(wlc_data, 'packet_loss')
-            wrr_loss_means.append(wrr_l_mean)
-            wrr_loss_stds.append(wrr_l_std)
-            wlc_loss_means.append(wlc_l_mean)
-            wlc_loss_stds.append(wlc_l_std)
-            
-            wrr_rt_mean, wrr_rt_std = self.extract_metric(wrr_data, 'response_time')
-            wlc_rt_mean, wlc_rt_std = self.extract_metric(wlc_data, 'response_time')
-            wrr_rt_means.append(wrr_rt_mean)
-            wrr_rt_stds.append(wrr_rt_std)
-            wlc_rt_means.append(wlc_rt_mean)
-            wlc_rt_stds.append(wlc_rt_std)
-        
-        if not scenarios:
-            print("   No data available")
-            return
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-        
-        x = np.arange(len(scenarios))
-        width = 0.35
-        
-        # Packet Loss
-        ax1.bar(x - width/2, wrr_loss_means, width, yerr=wrr_loss_stds,
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax1.bar(x + width/2, wlc_loss_means, width, yerr=wlc_loss_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax1.set_xlabel('Scenario')
-        ax1.set_ylabel('Packet Loss (%)')
-        ax1.set_title('Packet Loss' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax1.legend()
-        ax1.grid(axis='y', alpha=0.3)
-        
-        # Response Time
-        ax2.bar(x - width/2, wrr_rt_means, width, yerr=wrr_rt_stds,
-                label='WRR', color=self.colors['wrr'], alpha=0.8, capsize=5)
-        ax2.bar(x + width/2, wlc_rt_means, width, yerr=wlc_rt_stds,
-                label='WLC', color=self.colors['wlc'], alpha=0.8, capsize=5)
-        ax2.set_xlabel('Scenario')
-        ax2.set_ylabel('Response Time (ms)')
-        ax2.set_title('Response Time' + (' (Mean ± SD)' if self.use_aggregated else ''))
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(scenarios, rotation=45, ha='right')
-        ax2.legend()
-        ax2.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
-        filepath = f"{self.graphs_dir}/4_packet_loss_response_time.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   Saved: {filepath}")
+        self._two_panel_bar(self._metrics, *PANELS[3])
     
     def graph_performance_radar(self, results):
         """Graph 5: Performance Radar Chart"""
@@ -429,26 +601,26 @@ class GraphGenerator:
         metrics_names = ['Throughput', 'Fairness', 'Low Delay', 'Low Jitter', 'Low CPU', 'Low Loss']
         
         # Extract and normalize metrics
-        wrr_tcp_mean, _ = self.extract_metric(wrr_data, 'tcp_throughput')
-        wlc_tcp_mean, _ = self.extract_metric(wlc_data, 'tcp_throughput')
+        wrr_tcp_mean, _ = self._metric_cache[('wrr', scenario, 'tcp_throughput')]
+        wlc_tcp_mean, _ = self._metric_cache[('wlc', scenario, 'tcp_throughput')]
         max_throughput = max(wrr_tcp_mean, wlc_tcp_mean) if max(wrr_tcp_mean, wlc_tcp_mean) > 0 else 1
         
-        wrr_delay_mean, _ = self.extract_metric(wrr_data, 'delay')
-        wlc_delay_mean, _ = self.extract_metric(wlc_data, 'delay')
+        wrr_delay_mean, _ = self._metric_cache[('wrr', scenario, 'delay')]
+        wlc_delay_mean, _ = self._metric_cache[('wlc', scenario, 'delay')]
         max_delay = max(wrr_delay_mean, wlc_delay_mean) if max(wrr_delay_mean, wlc_delay_mean) > 0 else 1
         
-        wrr_jitter_mean, _ = self.extract_metric(wrr_data, 'jitter')
-        wlc_jitter_mean, _ = self.extract_metric(wlc_data, 'jitter')
+        wrr_jitter_mean, _ = self._metric_cache[('wrr', scenario, 'jitter')]
+        wlc_jitter_mean, _ = self._metric_cache[('wlc', scenario, 'jitter')]
         max_jitter = max(wrr_jitter_mean, wlc_jitter_mean) if max(wrr_jitter_mean, wlc_jitter_mean) > 0 else 1
         
-        wrr_cpu_mean, _ = self.extract_metric(wrr_data, 'cpu')
-        wlc_cpu_mean, _ = self.extract_metric(wlc_data, 'cpu')
+        wrr_cpu_mean, _ = self._metric_cache[('wrr', scenario, 'cpu')]
+        wlc_cpu_mean, _ = self._metric_cache[('wlc', scenario, 'cpu')]
         
-        wrr_fair_mean, _ = self.extract_metric(wrr_data, 'fairness_index')
-        wlc_fair_mean, _ = self.extract_metric(wlc_data, 'fairness_index')
+        wrr_fair_mean, _ = self._metric_cache[('wrr', scenario, 'fairness_index')]
+        wlc_fair_mean, _ = self._metric_cache[('wlc', scenario, 'fairness_index')]
         
-        wrr_loss_mean, _ = self.extract_metric(wrr_data, 'packet_loss')
-        wlc_loss_mean, _ = self.extract_metric(wlc_data, 'packet_loss')
+        wrr_loss_mean, _ = self._metric_cache[('wrr', scenario, 'packet_loss')]
+        wlc_loss_mean, _ = self._metric_cache[('wlc', scenario, 'packet_loss')]
         
         wrr_scores = [
             wrr_tcp_mean / max_throughput,
@@ -484,13 +656,13 @@ class GraphGenerator:
         ax.set_xticks(angles[:-1])
         ax.set_xticklabels(metrics_names)
         ax.set_ylim(0, 1)
-        ax.set_title(f'Performance Comparison\n({scenario.replace("_", " ").title()})', y=1.08)
+        ax.set_title(f'Performance Comparison\n({self._labels[scenario]})', y=1.08)
         ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
         ax.grid(True)
         
         plt.tight_layout()
         filepath = f"{self.graphs_dir}/5_performance_radar.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        filepath = self._save(filepath)
         plt.close()
         print(f"   Saved: {filepath}")
     
@@ -501,23 +673,15 @@ class GraphGenerator:
         scenarios = []
         data_rows = []
         
-        all_scenarios = set(results['wrr'].keys()) | set(results['wlc'].keys())
-        
-        for scenario in sorted(all_scenarios):
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
+        for scenario in self._common:
+            scenarios.append(self._labels[scenario])
             
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_tcp_mean, wrr_tcp_std = self.extract_metric(wrr_data, 'tcp_throughput')
-            wlc_tcp_mean, wlc_tcp_std = self.extract_metric(wlc_data, 'tcp_throughput')
-            wrr_fair_mean, wrr_fair_std = self.extract_metric(wrr_data, 'fairness_index')
-            wlc_fair_mean, wlc_fair_std = self.extract_metric(wlc_data, 'fairness_index')
-            wrr_cpu_mean, wrr_cpu_std = self.extract_metric(wrr_data, 'cpu')
-            wlc_cpu_mean, wlc_cpu_std = self.extract_metric(wlc_data, 'cpu')
+            wrr_tcp_mean, wrr_tcp_std = self._metric_cache[('wrr', scenario, 'tcp_throughput')]
+            wlc_tcp_mean, wlc_tcp_std = self._metric_cache[('wlc', scenario, 'tcp_throughput')]
+            wrr_fair_mean, wrr_fair_std = self._metric_cache[('wrr', scenario, 'fairness_index')]
+            wlc_fair_mean, wlc_fair_std = self._metric_cache[('wlc', scenario, 'fairness_index')]
+            wrr_cpu_mean, wrr_cpu_std = self._metric_cache[('wrr', scenario, 'cpu')]
+            wlc_cpu_mean, wlc_cpu_std = self._metric_cache[('wlc', scenario, 'cpu')]
             
             if self.use_aggregated:
                 row = [
@@ -561,8 +725,9 @@ class GraphGenerator:
         table.scale(1, 1.5)
         
         plt.title('Summary of WRR vs WLC Performance', fontsize=14, pad=20)
+        plt.tight_layout()
         filepath = f"{self.graphs_dir}/6_summary_table.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        filepath = self._save(filepath)
         plt.close()
         print(f"   Saved: {filepath}")
 
@@ -570,32 +735,34 @@ class GraphGenerator:
         """Graph 7: Correlation between CPU and Throughput"""
         print("\n[7/12] Generating CPU–Throughput Correlation Graph...")
         
-        cpu_vals, thr_vals, labels = [], [], []
+        # One point per (algorithm, scenario), preallocated
+        n = len(results['wrr']) + len(results['wlc'])
+        cpu_vals, thr_vals, labels = np.empty(n), np.empty(n), []
+        i = 0
         for algo in ['wrr', 'wlc']:
-            for scenario, data in results[algo].items():
-                cpu, _ = self.extract_metric(data, 'cpu')
-                thr, _ = self.extract_metric(data, 'tcp_throughput')
-                cpu_vals.append(cpu)
-                thr_vals.append(thr)
+            for scenario in results[algo]:
+                cpu_vals[i] = self._metric_cache[(algo, scenario, 'cpu')][0]
+                thr_vals[i] = self._metric_cache[(algo, scenario, 'tcp_throughput')][0]
                 labels.append(f"{algo.upper()}-{scenario}")
+                i += 1
         
-        if not cpu_vals:
+        if not n:
             print("   No data available")
             return
         
-        plt.figure(figsize=(10, 7))
-        plt.scatter(cpu_vals, thr_vals, c='purple', alpha=0.7)
+        fig, ax = self._pooled_figure('1x1', lambda: plt.subplots(figsize=(10, 7)), size=(10, 7))
+        ax.scatter(cpu_vals, thr_vals, c='purple', alpha=0.7)
         for i, lbl in enumerate(labels):
-            plt.text(cpu_vals[i]+0.3, thr_vals[i], lbl, fontsize=8)
+            ax.text(cpu_vals[i]+0.3, thr_vals[i], lbl, fontsize=8)
         
-        plt.xlabel("CPU Utilization (%)")
-        plt.ylabel("Throughput (Mbps)")
-        plt.title("Correlation between CPU Utilization and Throughput")
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("CPU Utilization (%)")
+        ax.set_ylabel("Throughput (Mbps)")
+        ax.set_title("Correlation between CPU Utilization and Throughput")
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
         
         filepath = f"{self.graphs_dir}/7_cpu_throughput_correlation.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._save(filepath)
         print(f"   Saved: {filepath}")
     
     def graph_overall_performance_score(self, results):
@@ -611,35 +778,28 @@ class GraphGenerator:
             'packet_loss': 0.1
         }
         
-        scores = {'wrr': [], 'wlc': []}
-        labels = []
+        all_scenarios = self._all_scenarios
+        labels = [self._labels[scenario] for scenario in all_scenarios]
+        score_metrics = ['tcp_throughput', 'fairness_index', 'delay', 'jitter', 'cpu', 'packet_loss']
         
-        all_scenarios = set(results['wrr'].keys()) | set(results['wlc'].keys())
-        for scenario in sorted(all_scenarios):
-            labels.append(scenario.replace('_', ' ').title())
-            
-            for algo in ['wrr', 'wlc']:
-                data = results[algo].get(scenario)
-                if not data:
-                    scores[algo].append(0)
-                    continue
-                
-                thr, _ = self.extract_metric(data, 'tcp_throughput')
-                fair, _ = self.extract_metric(data, 'fairness_index')
-                delay, _ = self.extract_metric(data, 'delay')
-                jitter, _ = self.extract_metric(data, 'jitter')
-                cpu, _ = self.extract_metric(data, 'cpu')
-                loss, _ = self.extract_metric(data, 'packet_loss')
-                
-                score = (
-                    thr * weights['throughput'] +
-                    fair * 100 * weights['fairness_index'] -
-                    delay * weights['delay'] -
-                    jitter * weights['jitter'] -
-                    cpu * weights['cpu'] -
-                    loss * weights['packet_loss']
-                )
-                scores[algo].append(score)
+        scores = {}
+        for algo in ['wrr', 'wlc']:
+            # One row per scenario; scenarios without data stay all-zero
+            # and therefore score 0
+            values = np.zeros((len(all_scenarios), len(score_metrics)))
+            for i, scenario in enumerate(all_scenarios):
+                if results[algo].get(scenario):
+                    values[i] = [self._metric_cache[(algo, scenario, m)][0] for m in score_metrics]
+            
+            thr, fair, delay, jitter, cpu, loss = values.T
+            scores[algo] = (
+                thr * weights['throughput'] +
+                fair * 100 * weights['fairness_index'] -
+                delay * weights['delay'] -
+                jitter * weights['jitter'] -
+                cpu * weights['cpu'] -
+                loss * weights['packet_loss']
+            )
         
         if not labels:
             print("   No data available")
@@ -648,265 +808,113 @@ class GraphGenerator:
         x = np.arange(len(labels))
         width = 0.35
         
-        plt.figure(figsize=(14, 6))
-        plt.bar(x - width/2, scores['wrr'], width, label='WRR', color=self.colors['wrr'])
-        plt.bar(x + width/2, scores['wlc'], width, label='WLC', color=self.colors['wlc'])
-        plt.xticks(x, labels, rotation=45, ha='right')
-        plt.ylabel("Weighted Performance Score")
-        plt.title("Overall Performance Comparison (Weighted Composite Score)")
-        plt.legend()
-        plt.tight_layout()
+        fig, ax = self._pooled_figure('1x1', lambda: plt.subplots(figsize=(14, 6)), size=(14, 6))
+        ax.bar(x - width/2, scores['wrr'], width, label='WRR', color=self.colors['wrr'])
+        ax.bar(x + width/2, scores['wlc'], width, label='WLC', color=self.colors['wlc'])
+        self._set_xlabels(ax, x, labels)
+        ax.set_ylabel("Weighted Performance Score")
+        ax.set_title("Overall Performance Comparison (Weighted Composite Score)")
+        ax.legend()
+        fig.tight_layout()
         
         filepath = f"{self.graphs_dir}/8_weighted_performance_score.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._save(filepath)
         print(f"   Saved: {filepath}")
 
     # =================== NEW: Load Intensity Line Charts =================== #
     
-    def graph_throughput_vs_load(self, results):
-        """Graph 9: Throughput vs Load Intensity (Line Chart)"""
-        print("\n[9/12] Generating Throughput vs Load Intensity...")
-        
-        scenarios = []
-        wrr_means, wrr_stds = [], []
-        wlc_means, wlc_stds = [], []
-        
-        all_scenarios = sorted(set(results['wrr'].keys()) | set(results['wlc'].keys()))
+    def _collect_means_stds(self, metric):
+        """(scenario labels, wrr_means, wrr_stds, wlc_means, wlc_stds) for
+        scenarios run with both algorithms"""
+        series = self._metrics[metric]
+        return (self._metrics['scenarios'],
+                series['wrr_mean'], series['wrr_std'],
+                series['wlc_mean'], series['wlc_std'])
+    
+    def _graph_metric_vs_load(self, metric, ylabel, title, filename, post_hook=None):
+        """Line chart of one metric across load scenarios (graphs 9-12)
         
-        for scenario in all_scenarios:
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_mean, wrr_std = self.extract_metric(wrr_data, 'tcp_throughput')
-            wlc_mean, wlc_std = self.extract_metric(wlc_data, 'tcp_throughput')
-            
-            wrr_means.append(wrr_mean)
-            wrr_stds.append(wrr_std)
-            wlc_means.append(wlc_mean)
-            wlc_stds.append(wlc_std)
+        post_hook(ax) runs after the lines are drawn, for extra reference
+        lines or limits.
+        """
+        scenarios, wrr_means, wrr_stds, wlc_means, wlc_stds = self._collect_means_stds(metric)
         
         if not scenarios:
             print("   No data available")
             return
         
+        self._render_load_line_chart(scenarios, wrr_means, wrr_stds, wlc_means, wlc_stds,
+                                     ylabel, title, post_hook)
+        
+        filepath = f"{self.graphs_dir}/{filename}"
+        filepath = self._save(filepath)
+        print(f"   Saved: {filepath}")
+    
+    def _render_load_line_chart(self, scenarios, wrr_means, wrr_stds, wlc_means, wlc_stds,
+                                ylabel, title, post_hook=None):
+        """Draw WRR and WLC lines (with error bars when aggregated)"""
         x = np.arange(len(scenarios))
         
-        plt.figure(figsize=(14, 7))
+        fig, ax = self._pooled_figure('1x1', lambda: plt.subplots(figsize=(14, 7)), size=(14, 7))
         
         # Plot lines with markers
-        plt.plot(x, wrr_means, 'o-', linewidth=2.5, markersize=8, 
+        ax.plot(x, wrr_means, 'o-', linewidth=2.5, markersize=8, 
                 label='Weighted Round-Robin', color=self.colors['wrr'])
-        plt.plot(x, wlc_means, 's-', linewidth=2.5, markersize=8,
+        ax.plot(x, wlc_means, 's-', linewidth=2.5, markersize=8,
                 label='Weighted Least Connection', color=self.colors['wlc'])
         
         # Add error bars if using aggregated results
         if self.use_aggregated:
-            plt.errorbar(x, wrr_means, yerr=wrr_stds, fmt='none', 
+            ax.errorbar(x, wrr_means, yerr=wrr_stds, fmt='none', 
                         ecolor=self.colors['wrr'], alpha=0.3, capsize=5)
-            plt.errorbar(x, wlc_means, yerr=wlc_stds, fmt='none',
+            ax.errorbar(x, wlc_means, yerr=wlc_stds, fmt='none',
                         ecolor=self.colors['wlc'], alpha=0.3, capsize=5)
         
-        plt.xlabel('Load Scenario', fontsize=12)
-        plt.ylabel('Average Network Throughput (Mbps)', fontsize=12)
-        plt.title('Throughput Performance Across Load Scenarios', fontsize=14, fontweight='bold')
-        plt.xticks(x, scenarios, rotation=45, ha='right')
-        plt.legend(loc='best', fontsize=11)
-        plt.grid(True, alpha=0.3, linestyle='--')
-        plt.tight_layout()
+        if post_hook is not None:
+            post_hook(ax)
         
-        filepath = f"{self.graphs_dir}/9_throughput_vs_load.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   Saved: {filepath}")
+        ax.set_xlabel('Load Scenario', fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        self._set_xlabels(ax, x, scenarios)
+        ax.legend(loc='best', fontsize=11)
+        ax.grid(True, alpha=0.3, linestyle='--')
+        fig.tight_layout()
+    
+    def graph_throughput_vs_load(self, results):
+        """Graph 9: Throughput vs Load Intensity (Line Chart)"""
+        print("\n[9/12] Generating Throughput vs Load Intensity...")
+        self._graph_metric_vs_load('tcp_throughput', 'Average Network Throughput (Mbps)',
+                                   'Throughput Performance Across Load Scenarios',
+                                   '9_throughput_vs_load.png')
     
     def graph_delay_vs_load(self, results):
         """Graph 10: Delay vs Load Intensity (Line Chart)"""
         print("\n[10/12] Generating Delay vs Load Intensity...")
-        
-        scenarios = []
-        wrr_means, wrr_stds = [], []
-        wlc_means, wlc_stds = [], []
-        
-        all_scenarios = sorted(set(results['wrr'].keys()) | set(results['wlc'].keys()))
-        
-        for scenario in all_scenarios:
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_mean, wrr_std = self.extract_metric(wrr_data, 'delay')
-            wlc_mean, wlc_std = self.extract_metric(wlc_data, 'delay')
-            
-            wrr_means.append(wrr_mean)
-            wrr_stds.append(wrr_std)
-            wlc_means.append(wlc_mean)
-            wlc_stds.append(wlc_std)
-        
-        if not scenarios:
-            print("   No data available")
-            return
-        
-        x = np.arange(len(scenarios))
-        
-        plt.figure(figsize=(14, 7))
-        
-        plt.plot(x, wrr_means, 'o-', linewidth=2.5, markersize=8,
-                label='Weighted Round-Robin', color=self.colors['wrr'])
-        plt.plot(x, wlc_means, 's-', linewidth=2.5, markersize=8,
-                label='Weighted Least Connection', color=self.colors['wlc'])
-        
-        if self.use_aggregated:
-            plt.errorbar(x, wrr_means, yerr=wrr_stds, fmt='none',
-                        ecolor=self.colors['wrr'], alpha=0.3, capsize=5)
-            plt.errorbar(x, wlc_means, yerr=wlc_stds, fmt='none',
-                        ecolor=self.colors['wlc'], alpha=0.3, capsize=5)
-        
-        plt.xlabel('Load Scenario', fontsize=12)
-        plt.ylabel('Average RTT Delay (ms)', fontsize=12)
-        plt.title('Network Delay Across Load Scenarios', fontsize=14, fontweight='bold')
-        plt.xticks(x, scenarios, rotation=45, ha='right')
-        plt.legend(loc='best', fontsize=11)
-        plt.grid(True, alpha=0.3, linestyle='--')
-        plt.tight_layout()
-        
-        filepath = f"{self.graphs_dir}/10_delay_vs_load.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   Saved: {filepath}")
+        self._graph_metric_vs_load('delay', 'Average RTT Delay (ms)',
+                                   'Network Delay Across Load Scenarios',
+                                   '10_delay_vs_load.png')
     
     def graph_cpu_vs_load(self, results):
         """Graph 11: CPU Utilization vs Load Intensity (Line Chart)"""
         print("\n[11/12] Generating CPU vs Load Intensity...")
-        
-        scenarios = []
-        wrr_means, wrr_stds = [], []
-        wlc_means, wlc_stds = [], []
-        
-        all_scenarios = sorted(set(results['wrr'].keys()) | set(results['wlc'].keys()))
-        
-        for scenario in all_scenarios:
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_mean, wrr_std = self.extract_metric(wrr_data, 'cpu')
-            wlc_mean, wlc_std = self.extract_metric(wlc_data, 'cpu')
-            
-            wrr_means.append(wrr_mean)
-            wrr_stds.append(wrr_std)
-            wlc_means.append(wlc_mean)
-            wlc_stds.append(wlc_std)
-        
-        if not scenarios:
-            print("   No data available")
-            return
-        
-        x = np.arange(len(scenarios))
-        
-        plt.figure(figsize=(14, 7))
-        
-        plt.plot(x, wrr_means, 'o-', linewidth=2.5, markersize=8,
-                label='Weighted Round-Robin', color=self.colors['wrr'])
-        plt.plot(x, wlc_means, 's-', linewidth=2.5, markersize=8,
-                label='Weighted Least Connection', color=self.colors['wlc'])
-        
-        if self.use_aggregated:
-            plt.errorbar(x, wrr_means, yerr=wrr_stds, fmt='none',
-                        ecolor=self.colors['wrr'], alpha=0.3, capsize=5)
-            plt.errorbar(x, wlc_means, yerr=wlc_stds, fmt='none',
-                        ecolor=self.colors['wlc'], alpha=0.3, capsize=5)
-        
-        plt.xlabel('Load Scenario', fontsize=12)
-        plt.ylabel('CPU Utilization (%)', fontsize=12)
-        plt.title('CPU Utilization Across Load Scenarios', fontsize=14, fontweight='bold')
-        plt.xticks(x, scenarios, rotation=45, ha='right')
-        plt.legend(loc='best', fontsize=11)
-        plt.grid(True, alpha=0.3, linestyle='--')
-        plt.tight_layout()
-        
-        filepath = f"{self.graphs_dir}/11_cpu_vs_load.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   Saved: {filepath}")
+        self._graph_metric_vs_load('cpu', 'CPU Utilization (%)',
+                                   'CPU Utilization Across Load Scenarios',
+                                   '11_cpu_vs_load.png')
     
     def graph_fairness_vs_load(self, results):
         """Graph 12: Fairness Index vs Load Intensity (Line Chart)"""
         print("\n[12/12] Generating Fairness vs Load Intensity...")
         
-        scenarios = []
-        wrr_means, wrr_stds = [], []
-        wlc_means, wlc_stds = [], []
-        
-        all_scenarios = sorted(set(results['wrr'].keys()) | set(results['wlc'].keys()))
+        def perfect_fairness(ax):
+            # Add perfect fairness reference line
+            ax.axhline(y=1.0, color='green', linestyle='--', alpha=0.5, 
+                       linewidth=1.5, label='Perfect Fairness')
+            ax.set_ylim([0, 1.1])
         
-        for scenario in all_scenarios:
-            wrr_data = results['wrr'].get(scenario)
-            wlc_data = results['wlc'].get(scenario)
-            
-            if not wrr_data or not wlc_data:
-                continue
-            
-            scenarios.append(scenario.replace('_', ' ').title())
-            
-            wrr_mean, wrr_std = self.extract_metric(wrr_data, 'fairness_index')
-            wlc_mean, wlc_std = self.extract_metric(wlc_data, 'fairness_index')
-            
-            wrr_means.append(wrr_mean)
-            wrr_stds.append(wrr_std)
-            wlc_means.append(wlc_mean)
-            wlc_stds.append(wlc_std)
-        
-        if not scenarios:
-            print("   No data available")
-            return
-        
-        x = np.arange(len(scenarios))
-        
-        plt.figure(figsize=(14, 7))
-        
-        plt.plot(x, wrr_means, 'o-', linewidth=2.5, markersize=8,
-                label='Weighted Round-Robin', color=self.colors['wrr'])
-        plt.plot(x, wlc_means, 's-', linewidth=2.5, markersize=8,
-                label='Weighted Least Connection', color=self.colors['wlc'])
-        
-        if self.use_aggregated:
-            plt.errorbar(x, wrr_means, yerr=wrr_stds, fmt='none',
-                        ecolor=self.colors['wrr'], alpha=0.3, capsize=5)
-            plt.errorbar(x, wlc_means, yerr=wlc_stds, fmt='none',
-                        ecolor=self.colors['wlc'], alpha=0.3, capsize=5)
-        
-        # Add perfect fairness reference line
-        plt.axhline(y=1.0, color='green', linestyle='--', alpha=0.5, 
-                   linewidth=1.5, label='Perfect Fairness')
-        
-        plt.xlabel('Load Scenario', fontsize=12)
-        plt.ylabel('Fairness Index (Jain\'s Index)', fontsize=12)
-        plt.title('Fairness Index Across Load Scenarios', fontsize=14, fontweight='bold')
-        plt.xticks(x, scenarios, rotation=45, ha='right')
-        plt.ylim([0, 1.1])
-        plt.legend(loc='best', fontsize=11)
-        plt.grid(True, alpha=0.3, linestyle='--')
-        plt.tight_layout()
-        
-        filepath = f"{self.graphs_dir}/12_fairness_vs_load.png"
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   Saved: {filepath}")
-
+        self._graph_metric_vs_load('fairness_index', 'Fairness Index (Jain\'s Index)',
+                                   'Fairness Index Across Load Scenarios',
+                                   '12_fairness_vs_load.png', post_hook=perfect_fairness)
 
 # ========================== Main Entry ========================== #
 if __name__ == "__main__":
@@ -932,21 +940,9 @@ if __name__ == "__main__":
     print("  Generating Graphs...")
     print("=" * 60)
     
-    # Original 8 graphs
-    gg.graph_throughput_comparison(results)
-    gg.graph_delay_jitter(results)
-    gg.graph_fairness_cpu(results)
-    gg.graph_packet_loss_response_time(results)
-    gg.graph_performance_radar(results)
-    gg.graph_summary_table(results)
-    gg.graph_correlation(results)
-    gg.graph_overall_performance_score(results)
-    
-    # NEW: 4 Load Intensity Line Charts
-    gg.graph_throughput_vs_load(results)
-    gg.graph_delay_vs_load(results)
-    gg.graph_cpu_vs_load(results)
-    gg.graph_fairness_vs_load(results)
+    # Original 8 graphs plus the 4 load intensity line charts
+    gg.generate_all(results)
+    gg.finalize()
     
     print("\n" + "=" * 60)
     print("✅ All 12 graphs generated successfully!")
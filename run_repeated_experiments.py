@@ -1,11 +1,68 @@
-import subprocess
 import time
 import json
 import os
 import glob
+import heapq
+import multiprocessing
 from datetime import datetime
 import numpy as np
 
+# orjson reads the per-run metrics and writes the aggregated JSON (NumPy
+# scalars included) much faster
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+def _summary(a):
+    """Return (mean, std, min, max) of a non-empty float64 array"""
+    return np.mean(a), np.std(a), np.min(a), np.max(a)
+
+
+# With numba, one compiled pass replaces the four NumPy reductions
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    @njit(cache=True)
+    def _summary(a):
+        """Return (mean, std, min, max) of a non-empty float64 array in one pass
+        
+        Welford's update; std is the population std, like np.std.
+        """
+        mean = 0.0
+        m2 = 0.0
+        lo = a[0]
+        hi = a[0]
+        for i in range(a.size):
+            x = a[i]
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += (x - mean) * delta
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+        return mean, (m2 / a.size) ** 0.5, lo, hi
+
+
+def _average(samples, key=None):
+    """Average of one run's samples (or of sample[key]), NaN if there are none"""
+    if not samples:
+        return np.nan
+    count = len(samples)
+    if key is not None:
+        samples = (sample[key] for sample in samples)
+    return np.fromiter(samples, dtype=np.float64, count=count).mean()
+
+
+def _positive(value):
+    """value if it was recorded (> 0), else NaN"""
+    return value if value > 0 else np.nan
+
 
 class RepeatedExperimentRunner:
     """Run experiments multiple times and aggregate results"""
@@ -17,6 +74,9 @@ class RepeatedExperimentRunner:
         self.aggregate_dir = f"results/aggregated/{algorithm}"
         os.makedirs(self.aggregate_dir, exist_ok=True)
         
+        # Aggregated results of this run, reused by export_aggregated_to_csv
+        self._aggregated_cache = {}
+        
         self.scenarios = ['office', 'streaming', 'elephant', 'mixed']
         self.scenario_names = {
             'office': 'voip_video_data_mix',
@@ -32,32 +92,31 @@ class RepeatedExperimentRunner:
         print(f"Algorithm: {self.algorithm.upper()}")
         print(f"{'='*70}\n")
         
-        # Run test_comprehensive.py
-        cmd = [
-            'sudo', 'python3', 'test_comprehensive.py',
-            self.algorithm, scenario
-        ]
-        
         try:
-            # Run the command
-            result = subprocess.run(
-                cmd,
-                input='\n',  # Auto-press Enter for controller ready prompt
-                text=True,
-                capture_output=False,
-                timeout=600  # 10 minutes timeout per scenario
+            # Each run builds and tears down its own network in a forked
+            # child: test_comprehensive is imported once, but runs stay
+            # independent and a hung run can still be killed
+            from test_comprehensive import run_scenario
+            
+            proc = multiprocessing.get_context('fork').Process(
+                target=run_scenario, args=(self.algorithm, scenario)
             )
+            proc.start()
+            proc.join(timeout=600)  # 10 minutes timeout per scenario
+            
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+                print(f"\nRun {run_number} timed out!")
+                return False
             
-            if result.returncode == 0:
+            if proc.exitcode == 0:
                 print(f"\nRun {run_number} completed successfully!")
                 return True
             else:
-                print(f"\nRun {run_number} failed with return code {result.returncode}")
+                print(f"\nRun {run_number} failed with exit code {proc.exitcode}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            print(f"\nRun {run_number} timed out!")
-            return False
         except Exception as e:
             print(f"\nRun {run_number} failed with error: {e}")
             return False
@@ -66,17 +125,16 @@ class RepeatedExperimentRunner:
         """Collect all results for a specific scenario"""
         scenario_name = self.scenario_names[scenario]
         pattern = f"{self.base_results_dir}/{scenario_name}_*/metrics.json"
-        files = sorted(glob.glob(pattern))
-        
-        # Get the last N files (most recent runs)
-        if len(files) > self.num_runs:
-            files = files[-self.num_runs:]
+        # Keep the last N files (most recent runs; the directory names end
+        # in a _YYYYmmdd_HHMMSS timestamp) without sorting the whole history
+        files = heapq.nlargest(self.num_runs, glob.iglob(pattern))
+        files.reverse()
         
         results = []
         for filepath in files:
             try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
+                with open(filepath, 'rb') as f:
+                    data = _loads(f.read())
                     results.append(data)
             except:
                 continue
@@ -95,137 +153,24 @@ class RepeatedExperimentRunner:
             'metrics': {}
         }
         
-        # TCP Throughput
-        tcp_throughputs = []
-        for result in results_list:
-            tcp = result.get('throughput', {}).get('tcp', [])
-            if tcp:
-                tcp_throughputs.append(sum(tcp) / len(tcp))
-        
-        if tcp_throughputs:
-            aggregated['metrics']['tcp_throughput'] = {
-                'mean': np.mean(tcp_throughputs),
-                'std': np.std(tcp_throughputs),
-                'min': np.min(tcp_throughputs),
-                'max': np.max(tcp_throughputs),
-                'values': tcp_throughputs
-            }
-        
-        # UDP Throughput
-        udp_throughputs = []
-        for result in results_list:
-            udp = result.get('throughput', {}).get('udp', [])
-            if udp:
-                udp_throughputs.append(sum(udp) / len(udp))
-        
-        if udp_throughputs:
-            aggregated['metrics']['udp_throughput'] = {
-                'mean': np.mean(udp_throughputs),
-                'std': np.std(udp_throughputs),
-                'min': np.min(udp_throughputs),
-                'max': np.max(udp_throughputs),
-                'values': udp_throughputs
-            }
-        
-        # Delay
-        delays = []
-        for result in results_list:
-            delay_data = result.get('delay', [])
-            if delay_data:
-                avg_delay = sum(d['avg'] for d in delay_data) / len(delay_data)
-                delays.append(avg_delay)
-        
-        if delays:
-            aggregated['metrics']['delay'] = {
-                'mean': np.mean(delays),
-                'std': np.std(delays),
-                'min': np.min(delays),
-                'max': np.max(delays),
-                'values': delays
-            }
-        
-        # Jitter
-        jitters = []
-        for result in results_list:
-            jitter_data = result.get('jitter', [])
-            if jitter_data:
-                avg_jitter = sum(jitter_data) / len(jitter_data)
-                jitters.append(avg_jitter)
-        
-        if jitters:
-            aggregated['metrics']['jitter'] = {
-                'mean': np.mean(jitters),
-                'std': np.std(jitters),
-                'min': np.min(jitters),
-                'max': np.max(jitters),
-                'values': jitters
-            }
-        
-        # Packet Loss
-        losses = []
-        for result in results_list:
-            loss_data = result.get('packet_loss', [])
-            if loss_data:
-                avg_loss = sum(loss_data) / len(loss_data)
-                losses.append(avg_loss)
-        
-        if losses:
-            aggregated['metrics']['packet_loss'] = {
-                'mean': np.mean(losses),
-                'std': np.std(losses),
-                'min': np.min(losses),
-                'max': np.max(losses),
-                'values': losses
-            }
-        
-        # CPU Utilization
-        cpus = []
-        for result in results_list:
-            cpu = result.get('cpu_utilization', {}).get('avg', 0)
-            if cpu > 0:
-                cpus.append(cpu)
-        
-        if cpus:
-            aggregated['metrics']['cpu'] = {
-                'mean': np.mean(cpus),
-                'std': np.std(cpus),
-                'min': np.min(cpus),
-                'max': np.max(cpus),
-                'values': cpus
-            }
-        
-        # Fairness Index
-        fairness = []
-        for result in results_list:
-            fi = result.get('fairness_index', 0)
-            if fi > 0:
-                fairness.append(fi)
-        
-        if fairness:
-            aggregated['metrics']['fairness_index'] = {
-                'mean': np.mean(fairness),
-                'std': np.std(fairness),
-                'min': np.min(fairness),
-                'max': np.max(fairness),
-                'values': fairness
-            }
+        # Per-run value of each metric (NaN = metric missing from that run)
+        per_run = [
+            ('tcp_throughput', lambda r: _average(r.get('throughput', {}).get('tcp', []))),
+            ('udp_throughput', lambda r: _average(r.get('throughput', {}).get('udp', []))),
+            ('delay', lambda r: _average(r.get('delay', []), key='avg')),
+            ('jitter', lambda r: _average(r.get('jitter', []))),
+            ('packet_loss', lambda r: _average(r.get('packet_loss', []))),
+            ('cpu', lambda r: _positive(r.get('cpu_utilization', {}).get('avg', 0))),
+            ('fairness_index', lambda r: _positive(r.get('fairness_index', 0))),
+            ('response_time', lambda r: _average(r.get('response_time', [])))
+        ]
         
-        # Response Time
-        response_times = []
-        for result in results_list:
-            rt_data = result.get('response_time', [])
-            if rt_data:
-                avg_rt = sum(rt_data) / len(rt_data)
-                response_times.append(avg_rt)
-        
-        if response_times:
-            aggregated['metrics']['response_time'] = {
-                'mean': np.mean(response_times),
-                'std': np.std(response_times),
-                'min': np.min(response_times),
-                'max': np.max(response_times),
-                'values': response_times
-            }
+        for metric, extract in per_run:
+            values = np.fromiter((extract(r) for r in results_list),
+                                 dtype=np.float64, count=len(results_list))
+            values = values[~np.isnan(values)]
+            if values.size:
+                aggregated['metrics'][metric] = self._summarize(values)
         
         # Store individual run details
         aggregated['individual_runs'] = []
@@ -241,12 +186,31 @@ class RepeatedExperimentRunner:
         
         return aggregated
     
+    def _summarize(self, values):
+        """mean/std/min/max/values of one metric's per-run values"""
+        mean, std, lo, hi = _summary(np.ascontiguousarray(values, dtype=np.float64))
+        return {
+            'mean': mean,
+            'std': std,
+            'min': lo,
+            'max': hi,
+            'values': values.tolist()
+        }
+    
     def save_aggregated_results(self, scenario, aggregated):
         """Save aggregated results to JSON"""
         filepath = f"{self.aggregate_dir}/{scenario}_aggregated.json"
         
-        with open(filepath, 'w') as f:
-            json.dump(aggregated, f, indent=2, default=str)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    aggregated,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    default=str
+                ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(aggregated, f, indent=2, default=str)
         
         print(f"\nAggregated results saved to: {filepath}")
     
@@ -314,34 +278,28 @@ class RepeatedExperimentRunner:
     
     def export_aggregated_to_csv(self):
         """Export all aggregated results to CSV"""
-        import csv
+        import pandas as pd
         
         csv_file = f"{self.aggregate_dir}/aggregated_summary.csv"
         
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow([
-                'Scenario',
-                'Algorithm',
-                'Num Runs',
-                'TCP Throughput Mean',
-                'TCP Throughput StdDev',
-                'Fairness Mean',
-                'Fairness StdDev',
-                'Delay Mean',
-                'Delay StdDev',
-                'Jitter Mean',
-                'Jitter StdDev',
-                'CPU Mean',
-                'CPU StdDev',
-                'Packet Loss Mean',
-                'Packet Loss StdDev'
-            ])
+        # (column prefix, metric, decimals) for the Mean/StdDev column pairs
+        stats = [
+            ('TCP Throughput', 'tcp_throughput', '%.2f'),
+            ('Fairness', 'fairness_index', '%.4f'),
+            ('Delay', 'delay', '%.2f'),
+            ('Jitter', 'jitter', '%.4f'),
+            ('CPU', 'cpu', '%.2f'),
+            ('Packet Loss', 'packet_loss', '%.4f')
+        ]
+        
+        # Data columns
+        table = {'Scenario': [], 'Algorithm': [], 'Num Runs': []}
+        values = {(metric, stat): [] for _, metric, _ in stats for stat in ('mean', 'std')}
+        
+        for scenario in self.scenarios:
+            data = self._aggregated_cache.get(scenario)
             
-            # Data rows
-            for scenario in self.scenarios:
+            if data is None:
                 filepath = f"{self.aggregate_dir}/{scenario}_aggregated.json"
                 
                 if not os.path.exists(filepath):
@@ -349,50 +307,27 @@ class RepeatedExperimentRunner:
                 
                 with open(filepath, 'r') as jf:
                     data = json.load(jf)
-                
-                metrics = data['metrics']
-                
-                row = [
-                    scenario,
-                    self.algorithm,
-                    data['num_runs'],
-                    f"{metrics.get('tcp_throughput', {}).get('mean', 0):.2f}",
-                    f"{metrics.get('tcp_throughput', {}).get('std', 0):.2f}",
-                    f"{metrics.get('fairness_index', {}).get('mean', 0):.4f}",
-                    f"{metrics.get('fairness_index', {}).get('std', 0):.4f}",
-                    f"{metrics.get('delay', {}).get('mean', 0):.2f}",
-                    f"{metrics.get('delay', {}).get('std', 0):.2f}",
-                    f"{metrics.get('jitter', {}).get('mean', 0):.4f}",
-                    f"{metrics.get('jitter', {}).get('std', 0):.4f}",
-                    f"{metrics.get('cpu', {}).get('mean', 0):.2f}",
-                    f"{metrics.get('cpu', {}).get('std', 0):.2f}",
-                    f"{metrics.get('packet_loss', {}).get('mean', 0):.4f}",
-                    f"{metrics.get('packet_loss', {}).get('std', 0):.4f}"
-                ]
-                
-                writer.writerow(row)
-        
-        print(f"\nAggregated CSV saved to: {csv_file}")
-    
-    def run_all_experiments(self):
-        """Run all experiments multiple times"""
-        print(f"\n{'='*70}")
-        print(f"REPEATED EXPERIMENTS")
-        print(f"{'='*70}")
-        print(f"\nAlgorithm: {self.algorithm.upper()}")
-        print(f"Number of runs per scenario: {self.num_runs}")
-        print(f"Scenarios: {', '.join(self.scenarios)}")
-        print(f"\nTotal experiments: {len(self.scenarios)} scenarios × {self.num_runs} runs = {len(self.scenarios) * self.num_runs} tests")
-        print(f"Estimated time: ~{len(self.scenarios) * self.num_runs * 5} minutes")
-        print(f"\n{'='*70}\n")
+            
+            metrics = data['metrics']
+            
+            table['Scenario'].append(scenario)
+            table['Algorithm'].append(self.algorithm)
+            table['Num Runs'].append(data['num_runs'])
+            for metric, stat in values:
+                values[(metric, stat)].append(metrics.get(metric, {}).get(stat, 0))
         
-        print("\nIMPORTANT: Make sure controller is running!")
-        controller_file = "weighted_round_robin_controller.py" if self.algorithm == 'wrr' else "weighted_least_connection_controller.py"
-        print(f"Command: ryu-manager --ofp-tcp-listen-port 6653 controllers/{controller_file} --verbose\n")
+        # Format each float column in one vectorized call
+        for prefix, metric, fmt in stats:
+            for stat, suffix in (('mean', 'Mean'), ('std', 'StdDev')):
+                column = np.asarray(values[(metric, stat)], dtype=np.float64)
+                table[f"{prefix} {suffix}"] = np.char.mod(fmt, column)
         
-        input("Press Enter to start repeated experiments...")
+        pd.DataFrame(table).to_csv(csv_file, index=False, lineterminator='\r\n')
         
-        # Run experiments
+        print(f"\nAggregated CSV saved to: {csv_file}")
+    
+    def _run_scenarios(self):
+        """Run every scenario num_runs times and aggregate each one"""
         for scenario in self.scenarios:
             print(f"\n\n{'#'*70}")
             print(f"# SCENARIO: {scenario.upper()}")
@@ -408,6 +343,9 @@ class RepeatedExperimentRunner:
                 
                 # Wait between runs
                 if run_num < self.num_runs:
+                    # Settle time for the controller between runs; the
+                    # port is not probed, a probe would open a stray
+                    # OpenFlow connection to Ryu
                     print(f"\nWaiting 10 seconds before next run...")
                     time.sleep(10)
             
@@ -419,10 +357,35 @@ class RepeatedExperimentRunner:
             
             if len(results) >= 2:
                 aggregated = self.aggregate_metrics(results)
+                self._aggregated_cache[scenario] = aggregated
                 self.save_aggregated_results(scenario, aggregated)
                 self.print_aggregated_summary(scenario, aggregated)
             else:
                 print(f"Warning: Not enough successful runs to aggregate ({len(results)} runs)")
+    
+    def run_all_experiments(self):
+        """Run all experiments multiple times"""
+        print(f"\n{'='*70}")
+        print(f"REPEATED EXPERIMENTS")
+        print(f"{'='*70}")
+        print(f"\nAlgorithm: {self.algorithm.upper()}")
+        print(f"Number of runs per scenario: {self.num_runs}")
+        print(f"Scenarios: {', '.join(self.scenarios)}")
+        print(f"\nTotal experiments: {len(self.scenarios)} scenarios × {self.num_runs} runs = {len(self.scenarios) * self.num_runs} tests")
+        print(f"Estimated time: ~{len(self.scenarios) * self.num_runs * 5} minutes")
+        print(f"\n{'='*70}\n")
+        
+        print("\nIMPORTANT: Make sure controller is running!")
+        controller_file = "weighted_round_robin_controller.py" if self.algorithm == 'wrr' else "weighted_least_connection_controller.py"
+        print(f"Command: ryu-manager --ofp-tcp-listen-port 6653 controllers/{controller_file} --verbose\n")
+        
+        input("Press Enter to start repeated experiments...")
+        
+        # Run experiments
+        from mininet.log import setLogLevel
+        setLogLevel('info')
+        
+        self._run_scenarios()
         
         # Export all to CSV
         print(f"\n{'='*70}")
@@ -4,12 +4,119 @@ from mininet.link import TCLink
 from mininet.log import setLogLevel, info
 import time
 import threading
+import asyncio
+import itertools
+import subprocess
 import json
 import os
+import io
+import re
 import psutil
 import csv
+import shutil
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
+# orjson writes metrics.json (NumPy values included) much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Stream only the 'end' summary of iperf3 reports when ijson has its C
+# backend; the pure-Python ones are slower than json.loads on these reports
+try:
+    import ijson
+    if ijson.backend != 'yajl2_c':
+        ijson = None
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Also write flows/CPU samples as Parquet when pyarrow is installed;
+# the CSV files are always written
+WRITE_PARQUET = True
+
+# ping output: per-reply RTTs and the single-probe "1 received" summary
+_TIME_RE = re.compile(r'time=([\d.]+)')
+_RCV_RE = re.compile(r'\b1 (?:packets )?received\b')
+
+# Root-namespace sysctls set for the test (see tune_network); the old
+# values are restored in cleanup()
+TUNED_SYSCTLS = {
+    'net.core.busy_poll': '50',
+    'net.core.busy_read': '50'
+}
+
+# ovs-ofctl dump-flows: packet count and output port of each priority=10
+# (load-balancing) rule; the port is "3" or "s13-eth3" when names are shown
+_LB_FLOW_RE = re.compile(r'n_packets=(\d+),.*?\bpriority=10\b.*?actions=.*?output:"?(?:[\w-]*eth)?(\d+)\b')
+
+# fping reports all RTT samples for a target on one line; use it when present
+FPING = shutil.which('fping')
+
+def _jain_index(v):
+    """Jain's index of a non-empty float64 array (0 if all values are 0)"""
+    s = np.sum(v)
+    s2 = np.dot(v, v)
+    if s2 == 0.0:
+        return 0.0
+    return (s * s) / (v.size * s2)
+
+
+# With numba, sum and sum of squares come from one compiled pass
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    @njit(cache=True)
+    def _jain_index(v):
+        """Jain's index of a non-empty float64 array (0 if all values are 0)"""
+        s = 0.0
+        s2 = 0.0
+        for i in range(v.size):
+            x = v[i]
+            s += x
+            s2 += x * x
+        if s2 == 0.0:
+            return 0.0
+        return (s * s) / (v.size * s2)
+
+
+# Bandwidth strings: "100M", "500K", "1G", "10Mbit", "2 mbps"; no unit = Mbps
+_BW_RE = re.compile(r'^\s*([\d.]+)\s*([KMG]?)', re.I)
+_BW_MULT = {'': 1.0, 'K': 1e-3, 'M': 1.0, 'G': 1e3}
+
+
+def parse_bandwidth_mbps(bandwidth):
+    """Parse an iperf bandwidth ("100M", "500K", 12) into Mbps, None if unknown"""
+    if not bandwidth:
+        return None
+    if not isinstance(bandwidth, str):
+        return float(bandwidth)
+    m = _BW_RE.match(bandwidth)
+    if m is None:
+        return None
+    try:
+        return float(m.group(1)) * _BW_MULT[m.group(2).upper()]
+    except ValueError:
+        return None
+
+
+def _stats(values):
+    """(mean, min, max) of a list of numbers; zeros when it is empty"""
+    a = np.asarray(values, dtype=np.float64)
+    if a.size == 0:
+        return 0, 0, 0
+    return a.mean(), a.min(), a.max()
+
 
 class MetricsCollector:
     """Collect and manage all performance metrics"""
@@ -17,13 +124,28 @@ class MetricsCollector:
     def __init__(self, scenario_name, algorithm):
         self.scenario_name = scenario_name
         self.algorithm = algorithm
-        self.results_dir = f"results/comprehensive/{algorithm}/{scenario_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        os.makedirs(self.results_dir, exist_ok=True)
+        started = datetime.now()
+        results_dir = f"results/comprehensive/{algorithm}/{scenario_name}_{started.strftime('%Y%m%d_%H%M%S')}"
+        self.results_dir = results_dir
+        # Runs started within the same second get _2, _3, ... instead of
+        # overwriting each other
+        suffix = 1
+        while True:
+            try:
+                os.makedirs(self.results_dir)
+                break
+            except FileExistsError:
+                suffix += 1
+                self.results_dir = f"{results_dir}_{suffix}"
+        
+        self.csv_path = f"{self.results_dir}/summary.csv"
+        self.flows_csv_path = f"{self.results_dir}/flows.csv"
+        self.json_path = f"{self.results_dir}/metrics.json"
         
         self.metrics = {
             'scenario': scenario_name,
             'algorithm': algorithm,
-            'start_time': datetime.now().isoformat(),
+            'start_time': started.isoformat(),
             'end_time': '',
             'flows': [],
             'throughput': {
@@ -42,95 +164,152 @@ class MetricsCollector:
             'fairness_index': 0,
             'response_time': []
         }
+        
+        # CPU samples (1/s) go into a preallocated array; grown if a run
+        # outlasts it, copied into metrics['cpu_utilization'] at finalize
+        self._cpu_buf = np.empty(600, dtype=np.float64)
+        self._cpu_n = 0
+    
+    def add_cpu_sample(self, cpu):
+        """Record one controller CPU utilization sample"""
+        if self._cpu_n == self._cpu_buf.size:
+            self._cpu_buf = np.concatenate((self._cpu_buf, np.empty_like(self._cpu_buf)))
+        self._cpu_buf[self._cpu_n] = cpu
+        self._cpu_n += 1
     
     def finalize(self):
         """Calculate final statistics and save"""
         self.metrics['end_time'] = datetime.now().isoformat()
         
         # Calculate CPU stats
-        if self.metrics['cpu_utilization']['samples']:
-            samples = self.metrics['cpu_utilization']['samples']
-            self.metrics['cpu_utilization']['avg'] = sum(samples) / len(samples)
-            self.metrics['cpu_utilization']['max'] = max(samples)
-            self.metrics['cpu_utilization']['min'] = min(samples)
+        if self._cpu_n:
+            samples = self._cpu_buf[:self._cpu_n]
+            self.metrics['cpu_utilization']['samples'] = samples.tolist()
+        else:
+            samples = np.asarray(self.metrics['cpu_utilization']['samples'], dtype=np.float64)
+        if samples.size:
+            self.metrics['cpu_utilization']['avg'] = float(samples.mean())
+            self.metrics['cpu_utilization']['max'] = float(samples.max())
+            self.metrics['cpu_utilization']['min'] = float(samples.min())
         
         self.save_results()
         self.export_to_csv()  # Auto-export to CSV
+        if WRITE_PARQUET and pa is not None:
+            self.export_to_parquet()
     
     def export_to_csv(self):
         """Export current test results to CSV"""
-        csv_file = f"{self.results_dir}/summary.csv"
+        csv_file = self.csv_path
         
-        # Calculate statistics
-        tcp_throughput = self.metrics['throughput']['tcp']
-        udp_throughput = self.metrics['throughput']['udp']
+        # Calculate statistics (one pass over each metric list)
+        tcp_avg, tcp_min, tcp_max = _stats(self.metrics['throughput']['tcp'])
+        udp_avg, _, _ = _stats(self.metrics['throughput']['udp'])
         delays = self.metrics['delay']
-        jitters = self.metrics['jitter']
-        packet_loss = self.metrics['packet_loss']
+        if delays:
+            table = np.array([(d['avg'], d['min'], d['max']) for d in delays], dtype=np.float64)
+            delay_avg, delay_min, delay_max = table[:, 0].mean(), table[:, 1].min(), table[:, 2].max()
+        else:
+            delay_avg = delay_min = delay_max = 0
+        jitter_avg, jitter_min, jitter_max = _stats(self.metrics['jitter'])
+        loss_avg, _, loss_max = _stats(self.metrics['packet_loss'])
         cpu = self.metrics['cpu_utilization']
-        response_times = self.metrics['response_time']
+        response_avg, _, _ = _stats(self.metrics['response_time'])
+        protocols = [f.get('protocol') for f in self.metrics['flows']]
         
         # Prepare data
         data = {
             'Scenario': self.scenario_name,
             'Algorithm': self.algorithm,
-            'TCP Throughput Avg (Mbps)': sum(tcp_throughput) / len(tcp_throughput) if tcp_throughput else 0,
-            'TCP Throughput Min (Mbps)': min(tcp_throughput) if tcp_throughput else 0,
-            'TCP Throughput Max (Mbps)': max(tcp_throughput) if tcp_throughput else 0,
-            'UDP Throughput Avg (Mbps)': sum(udp_throughput) / len(udp_throughput) if udp_throughput else 0,
-            'Delay Avg (ms)': sum(d['avg'] for d in delays) / len(delays) if delays else 0,
-            'Delay Min (ms)': min(d['min'] for d in delays) if delays else 0,
-            'Delay Max (ms)': max(d['max'] for d in delays) if delays else 0,
-            'Jitter Avg (ms)': sum(jitters) / len(jitters) if jitters else 0,
-            'Jitter Min (ms)': min(jitters) if jitters else 0,
-            'Jitter Max (ms)': max(jitters) if jitters else 0,
-            'Packet Loss Avg (%)': sum(packet_loss) / len(packet_loss) if packet_loss else 0,
-            'Packet Loss Max (%)': max(packet_loss) if packet_loss else 0,
+            'TCP Throughput Avg (Mbps)': tcp_avg,
+            'TCP Throughput Min (Mbps)': tcp_min,
+            'TCP Throughput Max (Mbps)': tcp_max,
+            'UDP Throughput Avg (Mbps)': udp_avg,
+            'Delay Avg (ms)': delay_avg,
+            'Delay Min (ms)': delay_min,
+            'Delay Max (ms)': delay_max,
+            'Jitter Avg (ms)': jitter_avg,
+            'Jitter Min (ms)': jitter_min,
+            'Jitter Max (ms)': jitter_max,
+            'Packet Loss Avg (%)': loss_avg,
+            'Packet Loss Max (%)': loss_max,
             'CPU Avg (%)': cpu['avg'],
             'CPU Max (%)': cpu['max'],
             'CPU Min (%)': cpu['min'],
             'Fairness Index': self.metrics['fairness_index'],
-            'Response Time Avg (ms)': sum(response_times) / len(response_times) if response_times else 0,
+            'Response Time Avg (ms)': response_avg,
             'Total Flows': len(self.metrics['flows']),
-            'TCP Flows': len([f for f in self.metrics['flows'] if f.get('protocol') == 'tcp']),
-            'UDP Flows': len([f for f in self.metrics['flows'] if f.get('protocol') == 'udp']),
+            'TCP Flows': protocols.count('tcp'),
+            'UDP Flows': protocols.count('udp'),
             'Test Date': self.metrics['start_time']
         }
         
-        # Write CSV
+        # Write CSV (built in memory, then written with a single write())
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=data.keys())
+        writer.writeheader()
+        writer.writerow({k: f"{v:.4f}" if isinstance(v, float) else v for k, v in data.items()})
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=data.keys())
-            writer.writeheader()
-            writer.writerow({k: f"{v:.4f}" if isinstance(v, float) else v for k, v in data.items()})
+            f.write(buf.getvalue())
         
         info(f"*** CSV summary exported to {csv_file} ***\n")
         
         # Also export detailed flows (NOW WITH BANDWIDTH_REQUESTED!)
-        flows_csv = f"{self.results_dir}/flows.csv"
+        flows_csv = self.flows_csv_path
+        buf = io.StringIO()
+        if self.metrics['flows']:
+            fieldnames = ['label', 'src', 'dst', 'protocol', 'bandwidth_requested', 'throughput', 'jitter', 'packet_loss']
+            writer = csv.DictWriter(buf, fieldnames=fieldnames)
+            writer.writeheader()
+            for flow in self.metrics['flows']:
+                writer.writerow({
+                    'label': flow.get('label', ''),
+                    'src': flow.get('src', ''),
+                    'dst': flow.get('dst', ''),
+                    'protocol': flow.get('protocol', ''),
+                    'bandwidth_requested': flow.get('bandwidth_requested', 'N/A'),
+                    'throughput': f"{flow.get('throughput', 0):.2f}",
+                    'jitter': f"{flow.get('jitter', 0):.4f}",
+                    'packet_loss': f"{flow.get('packet_loss', 0):.4f}"
+                })
         with open(flows_csv, 'w', newline='') as f:
-            if self.metrics['flows']:
-                fieldnames = ['label', 'src', 'dst', 'protocol', 'bandwidth_requested', 'throughput', 'jitter', 'packet_loss']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for flow in self.metrics['flows']:
-                    writer.writerow({
-                        'label': flow.get('label', ''),
-                        'src': flow.get('src', ''),
-                        'dst': flow.get('dst', ''),
-                        'protocol': flow.get('protocol', ''),
-                        'bandwidth_requested': flow.get('bandwidth_requested', 'N/A'),
-                        'throughput': f"{flow.get('throughput', 0):.2f}",
-                        'jitter': f"{flow.get('jitter', 0):.4f}",
-                        'packet_loss': f"{flow.get('packet_loss', 0):.4f}"
-                    })
+            f.write(buf.getvalue())
         
         info(f"*** Flow details exported to {flows_csv} ***\n")
     
+    def export_to_parquet(self):
+        """Export flows and CPU samples as snappy-compressed Parquet"""
+        flows = self.metrics['flows']
+        table = pa.table({
+            'label': [f.get('label', '') for f in flows],
+            'src': [f.get('src', '') for f in flows],
+            'dst': [f.get('dst', '') for f in flows],
+            'protocol': [f.get('protocol', '') for f in flows],
+            'bandwidth_requested': [str(f.get('bandwidth_requested', 'N/A')) for f in flows],
+            'throughput': pa.array([f.get('throughput', 0) for f in flows], type=pa.float64()),
+            'jitter': pa.array([f.get('jitter', 0) for f in flows], type=pa.float64()),
+            'packet_loss': pa.array([f.get('packet_loss', 0) for f in flows], type=pa.float64())
+        })
+        flows_parquet = f"{self.results_dir}/flows.parquet"
+        pq.write_table(table, flows_parquet, compression='snappy')
+        
+        samples = pa.table({
+            'cpu_percent': pa.array(self.metrics['cpu_utilization']['samples'], type=pa.float64())
+        })
+        pq.write_table(samples, f"{self.results_dir}/cpu_samples.parquet",
+                       compression='snappy', use_dictionary=True)
+        
+        info(f"*** Parquet flow details exported to {flows_parquet} ***\n")
+    
     def save_results(self):
         """Save metrics to JSON file"""
-        filepath = f"{self.results_dir}/metrics.json"
-        with open(filepath, 'w') as f:
-            json.dump(self.metrics, f, indent=2)
+        filepath = self.json_path
+        # json.dump writes chunk by chunk; encode the whole document first
+        if orjson is not None:
+            payload = orjson.dumps(self.metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(self.metrics, indent=2).encode()
+        with open(filepath, 'wb') as f:
+            f.write(payload)
         info(f"\n*** Results saved to {filepath} ***\n")
     
     def calculate_fairness_index(self, values):
@@ -138,64 +317,51 @@ class MetricsCollector:
         Calculate Jain's Fairness Index
         FI = (sum(xi))^2 / (n * sum(xi^2))
         """
-        if not values or len(values) == 0:
+        v = np.asarray(values, dtype=np.float64)
+        if v.size == 0:
             return 0
         
-        n = len(values)
-        sum_x = sum(values)
-        sum_x2 = sum(x**2 for x in values)
-        
-        if sum_x2 == 0:
+        fairness = _jain_index(v)
+        if fairness == 0:
             return 0
-        
-        fairness = (sum_x ** 2) / (n * sum_x2)
-        return fairness
+        return float(fairness)
     
     def calculate_normalized_fairness(self):
         """
         Calculate fairness normalized by requested bandwidth
         More accurate for heterogeneous traffic
         """
-        flow_ratios = []
+        achieved = []
+        requested = []
         
         for flow in self.metrics['flows']:
-            throughput_achieved = flow.get('throughput', 0)
-            bandwidth_requested = flow.get('bandwidth_requested', None)
-            
-            if not bandwidth_requested:
+            # Parsed when the flow was recorded; parse here for older records
+            mbps = flow.get('bandwidth_requested_mbps')
+            if mbps is None:
+                mbps = parse_bandwidth_mbps(flow.get('bandwidth_requested'))
+            if mbps is None:
                 # Fallback: skip this flow for fairness calculation
                 continue
-            
-            # Parse bandwidth string (e.g., "100M" -> 100, "500K" -> 0.5)
-            if isinstance(bandwidth_requested, str):
-                if 'M' in bandwidth_requested:
-                    requested = float(bandwidth_requested.replace('M', ''))
-                elif 'K' in bandwidth_requested:
-                    requested = float(bandwidth_requested.replace('K', '')) / 1000
-                else:
-                    try:
-                        requested = float(bandwidth_requested)
-                    except:
-                        continue
-            else:
-                requested = float(bandwidth_requested)
-            
-            if requested > 0 and throughput_achieved > 0:
-                # Calculate achievement ratio (remove capping to see true variance)
-                ratio = throughput_achieved / requested
-                flow_ratios.append(ratio)
+            achieved.append(flow.get('throughput', 0))
+            requested.append(mbps)
+        
+        achieved = np.asarray(achieved, dtype=np.float64)
+        requested = np.asarray(requested, dtype=np.float64)
+        keep = (requested > 0) & (achieved > 0)
+        # Achievement ratio per flow (uncapped to see true variance)
+        ratios = achieved[keep] / requested[keep]
         
-        if not flow_ratios or len(flow_ratios) < 2:
+        if ratios.size < 2:
             # Cannot calculate fairness with 0 or 1 flow
             info("   Warning: Not enough flows with bandwidth info for fairness calculation\n")
             return 0
         
         # Debug output
-        info(f"   DEBUG: {len(flow_ratios)} flows in fairness calculation\n")
-        info(f"   DEBUG: Ratios - Min: {min(flow_ratios):.4f}, Max: {max(flow_ratios):.4f}, Avg: {sum(flow_ratios)/len(flow_ratios):.4f}\n")
+        info(f"   DEBUG: {ratios.size} flows in fairness calculation\n")
+        info(f"   DEBUG: Ratios - Min: {ratios.min():.4f}, Max: {ratios.max():.4f}, Avg: {ratios.mean():.4f}\n")
         
         # Calculate Jain's Fairness Index on ratios
-        return self.calculate_fairness_index(flow_ratios)
+        return self.calculate_fairness_index(ratios)
     
     def print_summary(self):
         """Print comprehensive test summary"""
@@ -204,26 +370,28 @@ class MetricsCollector:
         info("="*70 + "\n")
         
         # Throughput
-        if self.metrics['throughput']['tcp']:
-            tcp_avg = sum(self.metrics['throughput']['tcp']) / len(self.metrics['throughput']['tcp'])
-            info(f"📊 Throughput (TCP): {tcp_avg:.2f} Mbps (avg of {len(self.metrics['throughput']['tcp'])} flows)\n")
+        tcp = np.asarray(self.metrics['throughput']['tcp'], dtype=np.float64)
+        if tcp.size:
+            info(f"📊 Throughput (TCP): {tcp.mean():.2f} Mbps (avg of {tcp.size} flows)\n")
         
-        if self.metrics['throughput']['udp']:
-            udp_avg = sum(self.metrics['throughput']['udp']) / len(self.metrics['throughput']['udp'])
-            info(f"📊 Throughput (UDP): {udp_avg:.2f} Mbps (avg of {len(self.metrics['throughput']['udp'])} flows)\n")
+        udp = np.asarray(self.metrics['throughput']['udp'], dtype=np.float64)
+        if udp.size:
+            info(f"📊 Throughput (UDP): {udp.mean():.2f} Mbps (avg of {udp.size} flows)\n")
         
         # Delay
-        if self.metrics['delay']:
-            avg_delays = [d['avg'] for d in self.metrics['delay']]
-            info(f"⏱️  Delay (RTT): {sum(avg_delays)/len(avg_delays):.2f} ms (avg)\n")
-            info(f"    Min: {min([d['min'] for d in self.metrics['delay']]):.2f} ms, "
-                 f"Max: {max([d['max'] for d in self.metrics['delay']]):.2f} ms\n")
+        delays = self.metrics['delay']
+        if delays:
+            stats = np.array([(d['avg'], d['min'], d['max']) for d in delays], dtype=np.float64)
+            info(f"⏱️  Delay (RTT): {stats[:, 0].mean():.2f} ms (avg)\n")
+            info(f"    Min: {stats[:, 1].min():.2f} ms, "
+                 f"Max: {stats[:, 2].max():.2f} ms\n")
         
         # Jitter
         if self.metrics['jitter']:
-            non_zero = [j for j in self.metrics['jitter'] if j > 0]
-            if non_zero:
-                info(f"📶 Jitter: {sum(non_zero)/len(non_zero):.4f} ms (avg of {len(non_zero)} UDP flows)\n")
+            jitter = np.asarray(self.metrics['jitter'], dtype=np.float64)
+            non_zero = jitter[jitter > 0]
+            if non_zero.size:
+                info(f"📶 Jitter: {non_zero.mean():.4f} ms (avg of {non_zero.size} UDP flows)\n")
             else:
                 info(f"📶 Jitter: N/A (no UDP flows measured)\n")
         else:
@@ -231,9 +399,10 @@ class MetricsCollector:
         
         # Packet Loss
         if self.metrics['packet_loss']:
-            non_zero = [p for p in self.metrics['packet_loss'] if p > 0]
-            if non_zero:
-                info(f"📉 Packet Loss: {sum(non_zero)/len(non_zero):.4f}% (avg)\n")
+            loss = np.asarray(self.metrics['packet_loss'], dtype=np.float64)
+            non_zero = loss[loss > 0]
+            if non_zero.size:
+                info(f"📉 Packet Loss: {non_zero.mean():.4f}% (avg)\n")
             else:
                 info(f"📉 Packet Loss: 0.00% (no loss detected)\n")
         
@@ -247,7 +416,7 @@ class MetricsCollector:
         
         # Response Time
         if self.metrics['response_time']:
-            avg_rt = sum(self.metrics['response_time']) / len(self.metrics['response_time'])
+            avg_rt = np.mean(self.metrics['response_time'])
             info(f"⚡ Response Time: {avg_rt:.2f} ms (avg)\n")
         
         info("="*70 + "\n")
@@ -261,6 +430,18 @@ class ComprehensiveTester:
         self.net = None
         self.cpu_monitor_thread = None
         self.cpu_monitoring = False
+        self._controller_proc = None
+        self.hosts = {}
+        # (host name, port) -> long-lived iperf3 server process
+        self.iperf_servers = {}
+        self._iperf_lock = threading.Lock()
+        # Worker threads shared by the elephant flows and the concurrent
+        # probes for the tester's lifetime
+        self.pool = ThreadPoolExecutor(max_workers=32)
+        # iperf3 processes are pinned to the usable cores round-robin
+        self._cores = itertools.cycle(sorted(os.sched_getaffinity(0)))
+        # sysctl name -> value before tune_network() changed it
+        self._saved_sysctls = {}
         
     def setup_network(self):
         """Setup Fat-Tree network"""
@@ -278,6 +459,9 @@ class ComprehensiveTester:
         )
         
         self.net.start()
+        # Resolve host nodes once; flows and probes look them up by name
+        self.hosts = {f'h{i}': self.net.get(f'h{i}') for i in range(1, 17)}
+        self.tune_network()
         info("*** Waiting for network to stabilize...\n")
         time.sleep(5)
         
@@ -289,9 +473,43 @@ class ComprehensiveTester:
         else:
             info("✓ Network ready\n")
     
+    def tune_network(self):
+        """
+        Enable NAPI busy polling for socket reads (50 us) and use the
+        fair-queueing qdisc on host interfaces
+        The net.core sysctls only exist in the root network namespace, so
+        they are set there once rather than per host.
+        """
+        for key, value in TUNED_SYSCTLS.items():
+            old = subprocess.run(['sysctl', '-n', key], capture_output=True, text=True)
+            if old.returncode != 0:
+                info(f"WARNING: cannot read {key}: {old.stderr.strip()}\n")
+                continue
+            result = subprocess.run(['sysctl', '-w', f'{key}={value}'], capture_output=True, text=True)
+            if result.returncode != 0:
+                info(f"WARNING: cannot set {key}: {result.stderr.strip()}\n")
+                continue
+            self._saved_sysctls[key] = old.stdout.strip()
+        
+        # Links carry no bw/delay limits, so there is no TCLink qdisc to keep
+        for host in self.hosts.values():
+            for intf in host.intfList():
+                host.cmd(f'tc qdisc replace dev {intf} root fq')
+    
+    def restore_sysctls(self):
+        """Put back the sysctl values tune_network() changed"""
+        for key, old in self._saved_sysctls.items():
+            result = subprocess.run(['sysctl', '-w', f'{key}={old}'], capture_output=True, text=True)
+            if result.returncode != 0:
+                info(f"WARNING: cannot restore {key}={old}: {result.stderr.strip()}\n")
+        self._saved_sysctls.clear()
+    
     def cleanup(self):
         """Cleanup network"""
         self.stop_cpu_monitoring()
+        self.stop_iperf_servers()
+        self.pool.shutdown(wait=False)
+        self.restore_sysctls()
         if self.net:
             info("\n*** Cleaning up network...\n")
             self.net.stop()
@@ -299,12 +517,13 @@ class ComprehensiveTester:
     def start_cpu_monitoring(self, collector):
         """Start background CPU monitoring"""
         self.cpu_monitoring = True
+        self._controller_proc = self.find_controller_process()
         
         def monitor():
             while self.cpu_monitoring:
                 cpu = self.get_controller_cpu()
                 if cpu > 0:
-                    collector.metrics['cpu_utilization']['samples'].append(cpu)
+                    collector.add_cpu_sample(cpu)
                 time.sleep(1)
         
         self.cpu_monitor_thread = threading.Thread(target=monitor, daemon=True)
@@ -316,14 +535,31 @@ class ComprehensiveTester:
         if self.cpu_monitor_thread:
             self.cpu_monitor_thread.join(timeout=2)
     
+    def find_controller_process(self):
+        """Locate the Ryu controller process and prime its CPU counter"""
+        try:
+            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                name = proc.info['name'] or ''
+                if 'ryu-manager' in name or 'python' in name:
+                    cmdline = proc.info['cmdline'] or []
+                    if any('ryu-manager' in cmd or 'controller' in cmd for cmd in cmdline):
+                        # First call only sets the baseline and returns 0.0
+                        proc.cpu_percent(None)
+                        return proc
+        except:
+            pass
+        return None
+    
     def get_controller_cpu(self):
         """Get CPU usage of Ryu controller"""
+        if self._controller_proc is None:
+            # Controller not found yet (or restarted): look it up again
+            self._controller_proc = self.find_controller_process()
+            return 0
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-                if 'ryu-manager' in proc.info['name'] or 'python' in proc.info['name']:
-                    cmdline = proc.cmdline()
-                    if any('ryu-manager' in cmd or 'controller' in cmd for cmd in cmdline):
-                        return proc.info['cpu_percent']
+            return self._controller_proc.cpu_percent(None)
+        except psutil.NoSuchProcess:
+            self._controller_proc = None
         except:
             pass
         return 0
@@ -334,22 +570,20 @@ class ComprehensiveTester:
         result = src.cmd(f'ping -c 1 -W 2 {dst.IP()}')
         elapsed = (time.time() - start) * 1000  # Convert to ms
         
-        if '1 received' in result or '1 packets received' in result:
+        if _RCV_RE.search(result):
             return elapsed
         return None
     
     def measure_delay(self, src, dst, count=50):
-        """Measure RTT delay using ping"""
-        result = src.cmd(f'ping -c {count} -i 0.01 {dst.IP()}')
-        
-        delays = []
-        for line in result.split('\n'):
-            if 'time=' in line:
-                try:
-                    time_str = line.split('time=')[1].split()[0]
-                    delays.append(float(time_str))
-                except:
-                    pass
+        """Measure RTT delay using fping (plain ping if fping is missing)"""
+        if FPING:
+            # -q -C prints "IP : 0.12 0.15 - 0.14 ..." ('-' = no reply)
+            result = src.cmd(f'fping -q -C {count} -p 10 {dst.IP()} 2>&1')
+            samples = result.partition(' : ')[2]
+            delays = [float(x) for x in samples.split() if x != '-']
+        else:
+            result = src.cmd(f'ping -c {count} -i 0.01 {dst.IP()}')
+            delays = [float(t) for t in _TIME_RE.findall(result)]
         
         if delays:
             return {
@@ -360,27 +594,108 @@ class ComprehensiveTester:
             }
         return None
     
-    def run_iperf_flow(self, src_name, dst_name, bandwidth, duration, protocol='tcp', port=5001):
-        """Run single iperf flow and return results"""
-        src = self.net.get(src_name)
-        dst = self.net.get(dst_name)
-        
-        # Start server
-        dst.popen(f'iperf3 -s -p {port}', shell=True)
-        time.sleep(0.5)
-        
-        # Run client
-        output_file = f'/tmp/iperf_{src_name}_{dst_name}_{port}.json'
-        
-        if protocol == 'tcp':
-            cmd = f'iperf3 -c {dst.IP()} -p {port} -t {duration} -b {bandwidth} -J > {output_file}'
+    def start_iperf_server(self, dst, port):
+        """Start an iperf3 server on dst:port unless one is already running"""
+        key = (dst.name, port)
+        with self._iperf_lock:
+            proc = self.iperf_servers.get(key)
+            if proc is not None and proc.poll() is None:
+                return
+            # Output is discarded: a server that lives across many tests
+            # would otherwise fill and block on the pipe
+            self.iperf_servers[key] = dst.popen(
+                ['iperf3', '-s', '-p', str(port), '-A', str(next(self._cores))],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        self.wait_port_open(dst, port)
+    
+    def wait_port_open(self, dst, port, timeout=2.0):
+        """
+        Poll until a TCP socket listens on dst:port (backing off 1 ms -> 50 ms)
+        Uses popen rather than dst.cmd(): other flows may be driving the
+        same host's shell concurrently.
+        """
+        deadline = time.time() + timeout
+        delay = 0.001
+        while time.time() < deadline:
+            probe = dst.popen(['ss', '-Hltn', 'sport', '=', f':{port}'],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            output, _ = probe.communicate()
+            if output.strip():
+                return True
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        return False
+    
+    def stop_iperf_server(self, dst, port):
+        """Stop the iperf3 server on dst:port, if any"""
+        with self._iperf_lock:
+            proc = self.iperf_servers.pop((dst.name, port), None)
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+    
+    def stop_iperf_servers(self):
+        """Stop all iperf3 servers started by this tester"""
+        with self._iperf_lock:
+            procs = list(self.iperf_servers.values())
+            self.iperf_servers.clear()
+        for proc in procs:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+    
+    def iperf_client_cmd(self, dst, bandwidth, duration, protocol='tcp', port=5001):
+        """iperf3 client command line; its JSON report goes to stdout"""
+        cmd = ['iperf3', '-c', dst.IP(), '-p', str(port)]
+        if protocol == 'udp':
+            cmd.append('-u')
         else:
-            cmd = f'iperf3 -c {dst.IP()} -p {port} -u -t {duration} -b {bandwidth} -J > {output_file}'
+            cmd.append('-N')  # TCP_NODELAY
+        cmd += ['-t', str(duration), '-b', bandwidth, '-A', str(next(self._cores)), '-J']
+        return cmd
+    
+    def run_iperf_flow(self, src, dst, bandwidth, duration, protocol='tcp', port=5001):
+        """Run single iperf flow between two host nodes and return results"""
+        # Server stays up and is reused by later flows on the same port
+        self.start_iperf_server(dst, port)
         
-        client_proc = src.popen(cmd, shell=True)
-        client_proc.wait()
+        cmd = self.iperf_client_cmd(dst, bandwidth, duration, protocol, port)
+        client_proc = src.popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            output, _ = client_proc.communicate(timeout=duration + 10)
+        except subprocess.TimeoutExpired:
+            client_proc.kill()
+            output, _ = client_proc.communicate()
+            # The server may still be serving the dead client; restart it next time
+            self.stop_iperf_server(dst, port)
+        
+        return self.parse_iperf_report(output, protocol)
+    
+    async def run_iperf_flow_async(self, src, dst, bandwidth, duration, protocol='tcp', port=5001):
+        """
+        run_iperf_flow for an asyncio event loop (no thread per flow)
+        The caller starts the server beforehand: start_iperf_server() blocks
+        while it polls for the listening socket.
+        """
+        # node.popen() is blocking; mnexec -da <pid> is the same namespace
+        # attach Mininet uses for it
+        cmd = self.iperf_client_cmd(dst, bandwidth, duration, protocol, port)
+        client_proc = await asyncio.create_subprocess_exec(
+            'mnexec', '-da', str(src.pid), *cmd,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        try:
+            output, _ = await asyncio.wait_for(client_proc.communicate(), timeout=duration + 10)
+        except asyncio.TimeoutError:
+            client_proc.kill()
+            output, _ = await client_proc.communicate()
+            self.stop_iperf_server(dst, port)
         
-        # Parse results
+        return self.parse_iperf_report(output, protocol)
+    
+    def parse_iperf_report(self, output, protocol):
+        """Extract throughput (Mbps), jitter and loss from an iperf3 -J report"""
         result_data = {
             'throughput': 0,
             'jitter': 0,
@@ -388,8 +703,12 @@ class ComprehensiveTester:
         }
         
         try:
-            result = src.cmd(f'cat {output_file}')
-            data = json.loads(result)
+            if ijson is not None:
+                # Skips building the per-second 'intervals' objects
+                end_data = next(ijson.items(io.BytesIO(output), 'end', use_float=True), None)
+                data = {} if end_data is None else {'end': end_data}
+            else:
+                data = json.loads(output)
             
             if 'end' in data:
                 end_data = data['end']
@@ -404,10 +723,6 @@ class ComprehensiveTester:
         except Exception as e:
             pass
         
-        # Cleanup
-        src.cmd(f'rm -f {output_file}')
-        dst.cmd(f'pkill -9 -f "iperf3 -s -p {port}"')
-        
         return result_data
     
     def get_flow_distribution(self):
@@ -415,36 +730,49 @@ class ComprehensiveTester:
         flow_counts = []
         
         # Check edge switches uplink ports
-        for switch_num in range(13, 21):
-            switch_name = f's{switch_num}'
+        def dump_ports(switch_name):
             try:
-                result = self.net.get(switch_name).cmd(
+                return self.net.get(switch_name).cmd(
                     f'ovs-ofctl dump-flows {switch_name} -O OpenFlow13'
                 )
-                
-                port3_packets = 0
-                port4_packets = 0
-                
-                for line in result.split('\n'):
-                    if 'priority=10' in line and 'n_packets=' in line:
-                        try:
-                            packets = int(line.split('n_packets=')[1].split(',')[0])
-                            if 'output:3' in line or 'output:"s' in line and '-eth3"' in line:
-                                port3_packets += packets
-                            elif 'output:4' in line or 'output:"s' in line and '-eth4"' in line:
-                                port4_packets += packets
-                        except:
-                            pass
-                
-                if port3_packets > 0:
-                    flow_counts.append(port3_packets)
-                if port4_packets > 0:
-                    flow_counts.append(port4_packets)
             except:
-                pass
+                return ''
+        
+        # Each switch has its own shell, so all eight can be queried at once
+        switch_names = [f's{switch_num}' for switch_num in range(13, 21)]
+        replies = list(self.pool.map(dump_ports, switch_names))
+        
+        for result in replies:
+            # Uplink ports 3 and 4: packets the load-balancing rules sent upwards
+            port_packets = {3: 0, 4: 0}
+            for packets, port in _LB_FLOW_RE.findall(result):
+                if int(port) in port_packets:
+                    port_packets[int(port)] += int(packets)
+            for port in (3, 4):
+                if port_packets[port] > 0:
+                    flow_counts.append(port_packets[port])
         
         return flow_counts
     
+    def measure_pairs(self, measure, pairs):
+        """
+        Run measure(src, dst) for each host pair concurrently
+        Each Mininet host has a single shell, so pairs sharing a source
+        host run one after another; results come back in input order.
+        """
+        by_src = {}
+        for i, (src, dst) in enumerate(pairs):
+            by_src.setdefault(src, []).append((i, dst))
+        
+        results = [None] * len(pairs)
+        
+        def run(src):
+            for i, dst in by_src[src]:
+                results[i] = measure(src, dst)
+        
+        list(self.pool.map(run, by_src))
+        return results
+    
     def run_traffic_with_metrics(self, flows, collector, measure_all_metrics=True):
         """
         Run traffic flows and measure all metrics
@@ -452,12 +780,14 @@ class ComprehensiveTester:
         """
         info(f"\nRunning {len(flows)} flows with complete metrics measurement...\n")
         
-        hosts = {f'h{i}': self.net.get(f'h{i}') for i in range(1, 17)}
+        hosts = self.hosts
         
         # 1. Measure Response Time (first packet latency)
         if measure_all_metrics:
             info("\nPhase 1: Measuring Response Time...\n")
             sample_flows = flows[:min(5, len(flows))]  # Sample first 5 flows
+            # One at a time: first-packet latency includes the controller's
+            # packet-in handling, which concurrent pings would queue up
             for src, dst, bw, _, _, _, label in sample_flows:
                 rt = self.measure_response_time(hosts[src], hosts[dst])
                 if rt:
@@ -468,8 +798,9 @@ class ComprehensiveTester:
         if measure_all_metrics:
             info("\nPhase 2: Measuring Baseline Delay...\n")
             sample_flows = flows[:min(5, len(flows))]  # Sample
-            for src, dst, _, _, _, _, label in sample_flows:
-                delay = self.measure_delay(hosts[src], hosts[dst], count=30)
+            delays = self.measure_pairs(lambda s, d: self.measure_delay(s, d, count=30),
+                                        [(hosts[f[0]], hosts[f[1]]) for f in sample_flows])
+            for (src, dst, _, _, _, _, label), delay in zip(sample_flows, delays):
                 if delay:
                     collector.metrics['delay'].append(delay)
                     info(f"   {src}->{dst}: {delay['avg']:.2f} ms (avg)\n")
@@ -478,32 +809,25 @@ class ComprehensiveTester:
         info("\nPhase 3: Starting traffic and monitoring...\n")
         self.start_cpu_monitoring(collector)
         
-        # 4. Run flows concurrently
-        threads = []
-        flow_results = []
-        
-        for src, dst, bw, dur, proto, port, label in flows:
-            def run_flow(s, d, bandwidth, duration, protocol, p, lbl):
-                info(f"  Starting {lbl}: {s}->{d} ({bandwidth}, {duration}s, {protocol.upper()})\n")
-                result = self.run_iperf_flow(s, d, bandwidth, duration, protocol, p)
-                result['label'] = lbl
-                result['src'] = s
-                result['dst'] = d
-                result['protocol'] = protocol
-                result['bandwidth_requested'] = bandwidth
-                flow_results.append(result)
-            
-            t = threading.Thread(
-                target=run_flow, 
-                args=(src, dst, bw, dur, proto, port, label)
-            )
-            t.start()
-            threads.append(t)
-            time.sleep(0.3)  # Stagger start
+        # 4. Run flows concurrently on one event loop
+        # Bring every server up first so the clients all start together
+        for _, dst, _, _, _, port, _ in flows:
+            self.start_iperf_server(hosts[dst], port)
         
-        # Wait for all flows to complete
-        for t in threads:
-            t.join()
+        async def run_flow(s, d, bandwidth, duration, protocol, p, lbl):
+            info(f"  Starting {lbl}: {s}->{d} ({bandwidth}, {duration}s, {protocol.upper()})\n")
+            result = await self.run_iperf_flow_async(hosts[s], hosts[d], bandwidth, duration, protocol, p)
+            result['label'] = lbl
+            result['src'] = s
+            result['dst'] = d
+            result['protocol'] = protocol
+            result['bandwidth_requested'] = bandwidth
+            return result
+        
+        async def run_flows():
+            return await asyncio.gather(*(run_flow(*flow) for flow in flows))
+        
+        flow_results = asyncio.run(run_flows())
         
         # 5. Stop CPU monitoring
         self.stop_cpu_monitoring()
@@ -520,7 +844,8 @@ class ComprehensiveTester:
                 'jitter': result['jitter'],
                 'packet_loss': result['packet_loss'],
                 'label': result['label'],
-                'bandwidth_requested': result['bandwidth_requested']
+                'bandwidth_requested': result['bandwidth_requested'],
+                'bandwidth_requested_mbps': parse_bandwidth_mbps(result['bandwidth_requested'])
             })
             
             # Aggregate metrics
@@ -544,8 +869,9 @@ class ComprehensiveTester:
         if measure_all_metrics:
             info("\nPhase 5: Measuring Post-Traffic Delay...\n")
             sample_flows = flows[:min(3, len(flows))]
-            for src, dst, _, _, _, _, label in sample_flows:
-                delay = self.measure_delay(hosts[src], hosts[dst], count=30)
+            delays = self.measure_pairs(lambda s, d: self.measure_delay(s, d, count=30),
+                                        [(hosts[f[0]], hosts[f[1]]) for f in sample_flows])
+            for (src, dst, _, _, _, _, label), delay in zip(sample_flows, delays):
                 if delay:
                     collector.metrics['delay'].append(delay)
                     info(f"   {src}->{dst}: {delay['avg']:.2f} ms\n")
@@ -654,18 +980,19 @@ class ComprehensiveTester:
         ]
         
         # Start elephant flows
-        elephant_threads = []
+        elephant_futures = []
         for src, dst, bw, dur, proto, port, label in elephant_flows:
             def run_elephant(s, d, bandwidth, duration, protocol, p, lbl):
                 info(f"  {lbl}: {s}->{d} ({bandwidth}, {duration}s)\n")
-                result = self.run_iperf_flow(s, d, bandwidth, duration, protocol, p)
+                result = self.run_iperf_flow(self.hosts[s], self.hosts[d], bandwidth, duration, protocol, p)
                 collector.metrics['flows'].append({
                     'src': s, 'dst': d, 'protocol': protocol,
                     'throughput': result['throughput'],
                     'jitter': result['jitter'],
                     'packet_loss': result['packet_loss'],
                     'label': lbl,
-                    'bandwidth_requested': bandwidth
+                    'bandwidth_requested': bandwidth,
+                    'bandwidth_requested_mbps': parse_bandwidth_mbps(bandwidth)
                 })
                 
                 if protocol == 'tcp':
@@ -676,10 +1003,9 @@ class ComprehensiveTester:
                         collector.metrics['jitter'].append(result['jitter'])
                     collector.metrics['packet_loss'].append(result['packet_loss'])
             
-            t = threading.Thread(target=run_elephant, 
-                               args=(src, dst, bw, dur, proto, port, label))
-            t.start()
-            elephant_threads.append(t)
+            elephant_futures.append(
+                self.pool.submit(run_elephant, src, dst, bw, dur, proto, port, label)
+            )
         
         # Start CPU monitoring
         self.start_cpu_monitoring(collector)
@@ -695,50 +1021,51 @@ class ComprehensiveTester:
                 (f'h{(round_num % 4) + 5}', f'h{(round_num % 4) + 13}', '3M', 5, 'udp', 7101+round_num*2, f'Mouse-UDP-R{round_num+1}'),
             ]
             
-            mice_threads = []
-            for src, dst, bw, dur, proto, port, label in mice_flows:
-                def run_mouse(s, d, bandwidth, duration, protocol, p, lbl):
-                    info(f"  {lbl}: {s}->{d} ({bandwidth}, {duration}s)\n")
-                    result = self.run_iperf_flow(s, d, bandwidth, duration, protocol, p)
-                    collector.metrics['flows'].append({
-                        'src': s, 'dst': d, 'protocol': protocol,
-                        'throughput': result['throughput'],
-                        'jitter': result['jitter'],
-                        'packet_loss': result['packet_loss'],
-                        'label': lbl,
-                        'bandwidth_requested': bandwidth
-                    })
-                    
-                    if protocol == 'tcp':
-                        collector.metrics['throughput']['tcp'].append(result['throughput'])
-                    else:
-                        collector.metrics['throughput']['udp'].append(result['throughput'])
-                        if result['jitter'] > 0:
-                            collector.metrics['jitter'].append(result['jitter'])
-                        collector.metrics['packet_loss'].append(result['packet_loss'])
+            async def run_mouse(s, d, bandwidth, duration, protocol, p, lbl):
+                info(f"  {lbl}: {s}->{d} ({bandwidth}, {duration}s)\n")
+                result = await self.run_iperf_flow_async(self.hosts[s], self.hosts[d], bandwidth, duration, protocol, p)
+                collector.metrics['flows'].append({
+                    'src': s, 'dst': d, 'protocol': protocol,
+                    'throughput': result['throughput'],
+                    'jitter': result['jitter'],
+                    'packet_loss': result['packet_loss'],
+                    'label': lbl,
+                    'bandwidth_requested': bandwidth,
+                    'bandwidth_requested_mbps': parse_bandwidth_mbps(bandwidth)
+                })
                 
-                t = threading.Thread(target=run_mouse,
-                                   args=(src, dst, bw, dur, proto, port, label))
-                t.start()
-                mice_threads.append(t)
+                if protocol == 'tcp':
+                    collector.metrics['throughput']['tcp'].append(result['throughput'])
+                else:
+                    collector.metrics['throughput']['udp'].append(result['throughput'])
+                    if result['jitter'] > 0:
+                        collector.metrics['jitter'].append(result['jitter'])
+                    collector.metrics['packet_loss'].append(result['packet_loss'])
             
-            # Wait for mice to finish
-            for t in mice_threads:
-                t.join()
+            async def run_mice():
+                await asyncio.gather(*(run_mouse(*flow) for flow in mice_flows))
+            
+            for _, dst, _, _, _, port, _ in mice_flows:
+                self.start_iperf_server(self.hosts[dst], port)
+            
+            # Run this round's mice on an event loop and wait for them
+            asyncio.run(run_mice())
         
         # Wait for elephants
         info("\nPhase 3: Waiting for elephant flows to complete...\n")
-        for t in elephant_threads:
-            t.join()
+        done, _ = wait(elephant_futures)
+        for fut in done:
+            if fut.exception() is not None:
+                info(f"   Elephant flow failed: {fut.exception()}\n")
         
         self.stop_cpu_monitoring()
         
         # Measure final metrics
         info("\nMeasuring final metrics...\n")
         sample_pairs = [('h1', 'h9'), ('h2', 'h10'), ('h3', 'h11')]
-        for src, dst in sample_pairs:
-            hosts = self.net.get(src), self.net.get(dst)
-            delay = self.measure_delay(hosts[0], hosts[1], count=30)
+        delays = self.measure_pairs(lambda s, d: self.measure_delay(s, d, count=30),
+                                    [(self.hosts[src], self.hosts[dst]) for src, dst in sample_pairs])
+        for delay in delays:
             if delay:
                 collector.metrics['delay'].append(delay)
         
@@ -786,20 +1113,59 @@ class ComprehensiveTester:
         return collector.metrics
 
 
+# Scenario name (or number) -> ComprehensiveTester method
+SCENARIO_METHODS = {
+    '1': 'scenario_voip_video_data_mix',
+    'office': 'scenario_voip_video_data_mix',
+    '2': 'scenario_live_streaming',
+    'streaming': 'scenario_live_streaming',
+    '3': 'scenario_elephant_mice',
+    'elephant': 'scenario_elephant_mice',
+    '4': 'scenario_mixed_load',
+    'mixed': 'scenario_mixed_load'
+}
+
+
+def run_scenario(algorithm, scenario, tester=None):
+    """Run one scenario in this process and return its metrics dict
+    
+    Pass a tester whose network is already set up to reuse it across
+    runs; otherwise a network is built for this run and torn down after.
+    The controller must already be running.
+    """
+    method = SCENARIO_METHODS[scenario.lower()]
+    
+    if tester is not None:
+        return getattr(tester, method)()
+    
+    tester = ComprehensiveTester(algorithm)
+    try:
+        tester.setup_network()
+        return getattr(tester, method)()
+    finally:
+        tester.cleanup()
+
+
 def main():
     import sys
     
-    if len(sys.argv) < 3:
+    # --yes: don't wait for Enter before starting (controller already up)
+    args = [arg for arg in sys.argv[1:] if arg != '--yes']
+    assume_ready = len(args) < len(sys.argv) - 1
+    
+    if len(args) < 2:
         info("\n" + "="*70 + "\n")
         info("Comprehensive Load Balancing Test\n")
         info("="*70 + "\n")
-        info("\nUsage: sudo python3 test_comprehensive.py [wrr|wlc] [scenario]\n")
+        info("\nUsage: sudo python3 test_comprehensive.py [wrr|wlc] [scenario] [--yes]\n")
         info("\nScenarios:\n")
         info("  1 or office      - VoIP + Video Conference + Data Mix\n")
         info("  2 or streaming   - Live Streaming Platform (4K/1080p/720p/480p)\n")
         info("  3 or elephant    - Elephant vs Mice Flows\n")
         info("  4 or mixed       - Mixed Load (Heavy/Medium/Light)\n")
         info("  all              - Run all scenarios\n")
+        info("\nOptions:\n")
+        info("  --yes            - Skip the controller-ready prompt\n")
         info("\nFeatures:\n")
         info("  - Complete metrics: Throughput, Delay, Jitter, Packet Loss\n")
         info("  - CPU Utilization monitoring\n")
@@ -814,8 +1180,8 @@ def main():
         info("\n" + "="*70 + "\n")
         sys.exit(1)
     
-    algorithm = sys.argv[1].lower()
-    scenario = sys.argv[2].lower()
+    algorithm = args[0].lower()
+    scenario = args[1].lower()
     
     if algorithm not in ['wrr', 'wlc']:
         info("Error: Algorithm must be 'wrr' or 'wlc'\n")
@@ -832,7 +1198,8 @@ def main():
                      else "weighted_least_connection_controller.py"
     info(f"Command: ryu-manager --ofp-tcp-listen-port 6653 controllers/{controller_file} --verbose\n")
     
-    input("\nPress Enter when controller is ready...")
+    if not assume_ready:
+        input("\nPress Enter when controller is ready...")
     
     tester = ComprehensiveTester(algorithm)
     